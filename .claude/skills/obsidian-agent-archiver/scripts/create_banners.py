@@ -8,14 +8,24 @@ Usage:
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
 try:
+    import PIL
     from PIL import Image, ImageDraw, ImageFont
 except ImportError:
     print("Pillow is required. Install with: pip install pillow")
     exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("NumPy is required. Install with: pip install numpy")
+    exit(1)
+
 # GB Automation Theme Colors
 THEME = {
     "bg_primary": "#F3F1E7",
@@ -98,64 +108,126 @@ def hex_to_rgb(hex_color: str) -> tuple:
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
-def create_banner(name: str, config: dict, output_dir: Path, width: int = 800, height: int = 200):
-    """Create a single banner image."""
-    bg_color = hex_to_rgb(config["bg"])
-    text_color = hex_to_rgb(config["text"])
+# Only the theme palette is ever used, so resolve every color to RGB up front
+_RGB_BY_HEX = {value: hex_to_rgb(value) for value in THEME.values()}
+_ACCENT_DEEP_RGB = _RGB_BY_HEX[THEME["accent_deep"]]
 
-    # Create image
-    img = Image.new("RGB", (width, height), bg_color)
-    draw = ImageDraw.Draw(img)
+for _config in BANNERS.values():
+    _config["bg_rgb"] = _RGB_BY_HEX[_config["bg"]]
+    _config["text_rgb"] = _RGB_BY_HEX[_config["text"]]
+    if _config.get("border"):
+        _config["border_rgb"] = _RGB_BY_HEX[_config["border"]]
+
+
+def pil_backend() -> str:
+    """Describe the active Pillow build (Pillow-SIMD versions carry a .postN suffix)."""
+    version = PIL.__version__
+    flavor = "Pillow-SIMD" if "post" in version else "Pillow"
+    return f"{flavor} {version}"
+
+
+@lru_cache(maxsize=None)
+def _get_fonts() -> tuple:
+    """Load (title, subtitle, icon) fonts once, falling back to the default font."""
+    try:
+        return (
+            ImageFont.truetype("arial.ttf", 48),
+            ImageFont.truetype("arial.ttf", 20),
+            ImageFont.truetype("arial.ttf", 36),
+        )
+    except OSError:
+        default_font = ImageFont.load_default()
+        return (default_font, default_font, default_font)
+
+
+def _make_linear_gradient(width: int, height: int, c0: tuple, c1: tuple) -> "np.ndarray":
+    """Return a contiguous (height, width, 3) uint8 left-to-right gradient from c0 to c1."""
+    ratio = (np.arange(width, dtype=np.float64) / width)[None, :, None]
+    start = np.array(c0, dtype=np.float64)
+    end = np.array(c1, dtype=np.float64)
+    row = (start * (1 - ratio) + end * ratio).astype(np.uint8)
+    return np.ascontiguousarray(np.broadcast_to(row, (height, width, 3)))
+
+
+def _background_key(config: dict) -> tuple:
+    """Key identifying everything drawn before the text layer."""
+    return (config["bg"], bool(config.get("gradient")), config.get("border"))
+
+
+def create_background(config: dict, width: int = 800, height: int = 200) -> "Image.Image":
+    """Create the background layer (fill, gradient, border) for a banner."""
+    bg_color = config["bg_rgb"]
 
-    # Add gradient effect for dashboard
+    # Create image (dashboard gets a horizontal gradient)
     if config.get("gradient"):
-        accent_deep = hex_to_rgb(THEME["accent_deep"])
-        for x in range(width):
-            ratio = x / width
-            r = int(bg_color[0] * (1 - ratio) + accent_deep[0] * ratio)
-            g = int(bg_color[1] * (1 - ratio) + accent_deep[1] * ratio)
-            b = int(bg_color[2] * (1 - ratio) + accent_deep[2] * ratio)
-            draw.line([(x, 0), (x, height)], fill=(r, g, b))
+        img = Image.fromarray(_make_linear_gradient(width, height, bg_color, _ACCENT_DEEP_RGB), "RGB")
+    else:
+        img = Image.new("RGB", (width, height), bg_color)
 
     # Add border for expert banner
     if config.get("border"):
-        border_color = hex_to_rgb(config["border"])
-        draw.rectangle([(0, 0), (width-1, height-1)], outline=border_color, width=3)
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([(0, 0), (width-1, height-1)], outline=config["border_rgb"], width=3)
 
-    # Try to load a nice font, fallback to default
-    try:
-        title_font = ImageFont.truetype("arial.ttf", 48)
-        subtitle_font = ImageFont.truetype("arial.ttf", 20)
-        icon_font = ImageFont.truetype("arial.ttf", 36)
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-        icon_font = ImageFont.load_default()
-
-    # Draw icon (left side)
-    icon_text = config.get("icon", "")
-    draw.text((40, height // 2 - 18), icon_text, fill=text_color, font=icon_font)
-
-    # Draw title (center)
-    title = config["title"]
-    title_bbox = draw.textbbox((0, 0), title, font=title_font)
-    title_width = title_bbox[2] - title_bbox[0]
-    draw.text(((width - title_width) // 2, height // 2 - 40), title, fill=text_color, font=title_font)
+    return img
+
+
+@lru_cache(maxsize=None)
+def _text_width(text: str, font) -> int:
+    """Ink width of text in font, measured once per (text, font) pair."""
+    left, _, right, _ = font.getbbox(text)
+    return right - left
 
-    # Draw subtitle (center, below title)
+
+def _text_layout(config: dict, width: int, height: int, fonts: tuple) -> list:
+    """Return the (position, font, text) draw ops for a banner's icon, title and subtitle."""
+    title_font, subtitle_font, icon_font = fonts
+    title = config["title"]
     subtitle = config["subtitle"]
-    subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-    subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
-    draw.text(((width - subtitle_width) // 2, height // 2 + 20), subtitle, fill=text_color, font=subtitle_font)
+    return [
+        # Icon (left side)
+        ((40, height // 2 - 18), icon_font, config.get("icon", "")),
+        # Title (center)
+        (((width - _text_width(title, title_font)) // 2, height // 2 - 40), title_font, title),
+        # Subtitle (center, below title)
+        (((width - _text_width(subtitle, subtitle_font)) // 2, height // 2 + 20), subtitle_font, subtitle),
+    ]
+
+
+def draw_text_on(base: "Image.Image", config: dict, fonts: tuple = None) -> "Image.Image":
+    """Copy a background layer and draw the banner's icon, title and subtitle on it."""
+    img = base.copy()
+    draw = ImageDraw.Draw(img)
+    width, height = img.size
+    text_color = config["text_rgb"]
+
+    for position, font, text in _text_layout(config, width, height, fonts or _get_fonts()):
+        draw.text(position, text, fill=text_color, font=font)
+
+    return img
+
 
-    # Save image
+def create_banner(name: str, config: dict, output_dir: Path, width: int = 800, height: int = 200,
+                  fonts: tuple = None, base: "Image.Image" = None):
+    """Create a single banner image, optionally on a pre-rendered background."""
+    if base is None:
+        base = create_background(config, width, height)
+    img = draw_text_on(base, config, fonts)
+
+    # Save image; banners are small local assets, so favor fast zlib over size
     output_path = output_dir / f"{name}.png"
-    img.save(output_path, "PNG")
+    img.save(output_path, "PNG", compress_level=1, optimize=False)
     print(f"Created: {output_path}")
 
     return output_path
 
 
+def _render_group(group: list, output_dir: Path, width: int, height: int) -> list:
+    """Render (name, config) banners sharing one background; top-level so worker processes can pickle it."""
+    base = create_background(group[0][1], width, height)
+    return [create_banner(name, config, output_dir, width, height, base=base) for name, config in group]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate Obsidian banner images")
     parser.add_argument(
@@ -183,10 +255,23 @@ def main():
 
     print(f"Generating banners in: {output_dir}")
     print(f"Dimensions: {args.width}x{args.height}")
+    print(f"Backend: {pil_backend()}")
     print("-" * 40)
 
+    # Render each unique background once and reuse it for every banner on it
+    groups = {}
     for name, config in BANNERS.items():
-        create_banner(name, config, output_dir, args.width, args.height)
+        groups.setdefault(_background_key(config), []).append((name, config))
+
+    # Groups are independent and CPU-bound; each worker loads its own fonts
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(
+            _render_group,
+            groups.values(),
+            repeat(output_dir),
+            repeat(args.width),
+            repeat(args.height),
+        ))
 
     print("-" * 40)
     print(f"Generated {len(BANNERS)} banner images")
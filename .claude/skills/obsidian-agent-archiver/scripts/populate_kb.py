@@ -10,18 +10,42 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 import re
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
 
 # Template paths (relative to skill directory)
 SKILL_DIR = Path(__file__).parent.parent
 TEMPLATE_DIR = SKILL_DIR / "templates"
 
+# Content digests of generated docs, keyed by path relative to the KB root
+HASH_CACHE_FILE = ".hashes.json"
+
+# ADW workflow kind from filename; "fix" anywhere takes precedence over "review"
+_ADW_RE = re.compile(r"(?:.*(?P<fix>fix)|.*(?P<review>review))", re.DOTALL)
+_ADW_CLASS = {
+    "fix": ("plan_build_review_fix", 4),
+    "review": ("plan_build_review", 3),
+    None: ("plan_build", 2),
+}
+
+# YAML frontmatter block at the very top of a markdown file
+_FM_RE = re.compile(r"\A---[ \t]*\r?\n(?:(.*?)\r?\n)??---[ \t]*(?:\r?\n|\Z)(.*)", re.DOTALL)
 
+
+@lru_cache(maxsize=None)
 def load_template(template_name: str) -> str:
     """Load a template file."""
     template_path = TEMPLATE_DIR / f"{template_name}-template.md"
@@ -30,25 +54,32 @@ def load_template(template_name: str) -> str:
     return ""
 
 
-def parse_agent_file(file_path: Path) -> Dict:
-    """Parse an agent markdown file with YAML frontmatter."""
-    content = file_path.read_text(encoding="utf-8")
+def _parse_frontmatter(content: str) -> Tuple[Dict, str]:
+    """Split markdown into (frontmatter dict, body); body is stripped when frontmatter exists."""
+    match = _FM_RE.match(content)
+    if not match:
+        return {}, content
 
-    # Extract YAML frontmatter
-    frontmatter = {}
-    body = content
+    block = match.group(1)
+    try:
+        frontmatter = (yaml.load(block, Loader=_YLoader) or {}) if block is not None else {}
+    except yaml.YAMLError:
+        frontmatter = {}
+    return frontmatter, match.group(2).strip()
 
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            try:
-                frontmatter = yaml.safe_load(parts[1]) or {}
-            except yaml.YAMLError:
-                pass
-            body = parts[2].strip()
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 text file with a single buffered read."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def parse_agent_file(file_path: str, content: str) -> Dict:
+    """Parse an agent markdown file's content with YAML frontmatter."""
+    frontmatter, body = _parse_frontmatter(content)
 
     return {
-        "name": frontmatter.get("name", file_path.stem),
+        "name": frontmatter.get("name", os.path.splitext(os.path.basename(file_path))[0]),
         "description": frontmatter.get("description", ""),
         "tools": frontmatter.get("tools", ""),
         "model": frontmatter.get("model", "sonnet"),
@@ -58,102 +89,120 @@ def parse_agent_file(file_path: Path) -> Dict:
     }
 
 
-def scan_agents(repo_path: Path) -> List[Dict]:
+def _map(executor: Optional[Executor], fn: Callable, items: Iterable) -> List:
+    """Map fn over items on the executor when one is given, otherwise serially."""
+    if executor is None:
+        return [fn(item) for item in items]
+    return list(executor.map(fn, items))
+
+
+def _load_agent_file(path: str) -> Dict:
+    """Read and parse one agent file."""
+    return parse_agent_file(path, _read_text(path))
+
+
+def scan_agents(repo_path: Path, executor: Optional[Executor] = None) -> List[Dict]:
     """Scan for agent definitions in .claude/agents/."""
-    agents = []
     agents_dir = repo_path / ".claude" / "agents"
+    if not agents_dir.is_dir():
+        return []
 
-    if agents_dir.exists():
-        for agent_file in agents_dir.glob("*.md"):
-            if not agent_file.name.startswith("_"):
-                agents.append(parse_agent_file(agent_file))
+    with os.scandir(agents_dir) as entries:
+        paths = [
+            entry.path for entry in entries
+            if entry.name.endswith(".md") and not entry.name.startswith("_") and entry.is_file()
+        ]
 
-    return agents
+    return _map(executor, _load_agent_file, paths)
+
+
+def _classify_adw(name: str) -> Tuple[str, int]:
+    """Determine (pattern, total_steps) from an ADW workflow name."""
+    match = _ADW_RE.match(name)
+    return _ADW_CLASS[match.lastgroup if match else None]
+
+
+def _adw_entry(name: str, source_path: str) -> Dict:
+    """Build the ADW record for one workflow file."""
+    pattern, steps = _classify_adw(name)
+    return {
+        "name": name,
+        "pattern": pattern,
+        "total_steps": steps,
+        "source_path": source_path,
+    }
 
 
 def scan_adw_workflows(repo_path: Path) -> List[Dict]:
     """Scan for ADW workflow files."""
-    adws = []
     adw_dir = repo_path / "adws" / "adw_workflows"
+    if not adw_dir.is_dir():
+        return []
+
+    with os.scandir(adw_dir) as entries:
+        return [
+            _adw_entry(entry.name[:-3].replace("adw_", ""), entry.path)
+            for entry in entries
+            if entry.name.startswith("adw_") and entry.name.endswith(".py")
+        ]
+
+
+def _load_expert(item: Tuple[str, str]) -> Optional[Dict]:
+    """Read one (name, expertise.yaml path) pair; None if the YAML is invalid."""
+    name, expertise_file = item
+    try:
+        content = yaml.load(_read_text(expertise_file), Loader=_YLoader)
+    except yaml.YAMLError:
+        return None
+    return {
+        "name": name,
+        "overview": content.get("overview", {}),
+        "source_path": expertise_file,
+    }
 
-    if adw_dir.exists():
-        for workflow_file in adw_dir.glob("adw_*.py"):
-            name = workflow_file.stem.replace("adw_", "")
 
-            # Determine pattern from filename
-            if "fix" in name:
-                pattern = "plan_build_review_fix"
-                steps = 4
-            elif "review" in name:
-                pattern = "plan_build_review"
-                steps = 3
-            else:
-                pattern = "plan_build"
-                steps = 2
+def scan_experts(repo_path: Path, executor: Optional[Executor] = None) -> List[Dict]:
+    """Scan for expert definitions."""
+    experts_dir = repo_path / ".claude" / "commands" / "experts"
+    if not experts_dir.is_dir():
+        return []
 
-            adws.append({
-                "name": name,
-                "pattern": pattern,
-                "total_steps": steps,
-                "source_path": str(workflow_file),
-            })
+    with os.scandir(experts_dir) as entries:
+        candidates = [
+            (entry.name, os.path.join(entry.path, "expertise.yaml"))
+            for entry in entries if entry.is_dir()
+        ]
+    candidates = [(name, path) for name, path in candidates if os.path.isfile(path)]
 
-    return adws
+    return [expert for expert in _map(executor, _load_expert, candidates) if expert is not None]
 
 
-def scan_experts(repo_path: Path) -> List[Dict]:
-    """Scan for expert definitions."""
-    experts = []
-    experts_dir = repo_path / ".claude" / "commands" / "experts"
+def _load_skill(item: Tuple[str, str]) -> Dict:
+    """Read one (directory name, SKILL.md path) pair."""
+    name, skill_file = item
+    frontmatter, _ = _parse_frontmatter(_read_text(skill_file))
+    return {
+        "name": frontmatter.get("name", name),
+        "description": frontmatter.get("description", ""),
+        "dependencies": frontmatter.get("dependencies", ""),
+        "source_path": skill_file,
+    }
+
 
-    if experts_dir.exists():
-        for expert_dir in experts_dir.iterdir():
-            if expert_dir.is_dir():
-                expertise_file = expert_dir / "expertise.yaml"
-                if expertise_file.exists():
-                    try:
-                        content = yaml.safe_load(expertise_file.read_text(encoding="utf-8"))
-                        experts.append({
-                            "name": expert_dir.name,
-                            "overview": content.get("overview", {}),
-                            "source_path": str(expertise_file),
-                        })
-                    except yaml.YAMLError:
-                        pass
-
-    return experts
-
-
-def scan_skills(repo_path: Path) -> List[Dict]:
+def scan_skills(repo_path: Path, executor: Optional[Executor] = None) -> List[Dict]:
     """Scan for skill definitions."""
-    skills = []
     skills_dir = repo_path / ".claude" / "skills"
+    if not skills_dir.is_dir():
+        return []
 
-    if skills_dir.exists():
-        for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir():
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    content = skill_file.read_text(encoding="utf-8")
-
-                    # Parse frontmatter
-                    frontmatter = {}
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            try:
-                                frontmatter = yaml.safe_load(parts[1]) or {}
-                            except:
-                                pass
-
-                    skills.append({
-                        "name": frontmatter.get("name", skill_dir.name),
-                        "description": frontmatter.get("description", ""),
-                        "dependencies": frontmatter.get("dependencies", ""),
-                        "source_path": str(skill_file),
-                    })
-
-    return skills
+    with os.scandir(skills_dir) as entries:
+        candidates = [
+            (entry.name, os.path.join(entry.path, "SKILL.md"))
+            for entry in entries if entry.is_dir()
+        ]
+    candidates = [(name, path) for name, path in candidates if os.path.isfile(path)]
+
+    return _map(executor, _load_skill, candidates)
 
 
 def create_kb_structure(obsidian_vault: Path):
@@ -180,18 +229,15 @@ def create_kb_structure(obsidian_vault: Path):
     return kb_path
 
 
-def generate_agent_doc(agent: Dict, kb_path: Path) -> Path:
-    """Generate documentation for an agent."""
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    content = f"""---
+# Document templates, parsed once and filled with str.format_map
+_AGENT_TEMPLATE = """---
 type: agent
-name: "{agent['name']}"
+name: "{name}"
 banner: "[[_assets/banners/agent-banner.png]]"
 status: active
 version: 1.0.0
-model: {agent.get('model', 'claude-opus-4-5-20251101')}
-tools: {agent.get('tools', '[]')}
+model: {model}
+tools: {tools}
 created: {today}
 updated: {today}
 tags: [agent]
@@ -200,70 +246,30 @@ cssclasses: [cards, cards-cover]
 
 ![[agent-banner.png|banner]]
 
-# {agent['name']}
+# {name}
 
 ## Purpose
-{agent.get('description', 'No description provided.')}
+{description}
 
 ## System Prompt
 ```
-{agent.get('body', 'See source file for full prompt.')}
+{body}
 ```
 
 ## Source Files
-- Agent Definition: `{agent['source_path']}`
+- Agent Definition: `{source_path}`
 
 ## Changelog
 - {today}: Auto-generated from source repository
 """
 
-    output_path = kb_path / "02-Agents" / f"{agent['name']}.md"
-    output_path.write_text(content, encoding="utf-8")
-    print(f"Generated: {output_path}")
-
-    return output_path
-
-
-def generate_adw_doc(adw: Dict, kb_path: Path) -> Path:
-    """Generate documentation for an ADW."""
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    # Generate mermaid diagram based on pattern
-    if adw['total_steps'] == 2:
-        diagram = """```mermaid
-graph LR
-    A[Plan] --> B[Build]
-    style A fill:#D97757,color:#fff
-    style B fill:#C26D52,color:#fff
-```"""
-    elif adw['total_steps'] == 3:
-        diagram = """```mermaid
-graph LR
-    A[Plan] --> B[Build]
-    B --> C[Review]
-    style A fill:#D97757,color:#fff
-    style B fill:#C26D52,color:#fff
-    style C fill:#191919,color:#fff
-```"""
-    else:
-        diagram = """```mermaid
-graph LR
-    A[Plan] --> B[Build]
-    B --> C[Review]
-    C --> D[Fix]
-    style A fill:#D97757,color:#fff
-    style B fill:#C26D52,color:#fff
-    style C fill:#191919,color:#fff
-    style D fill:#5C5C5C,color:#fff
-```"""
-
-    content = f"""---
+_ADW_TEMPLATE = """---
 type: adw
-name: "{adw['name']}"
+name: "{name}"
 banner: "[[_assets/banners/adw-banner.png]]"
 status: active
-pattern: {adw['pattern']}
-total_steps: {adw['total_steps']}
+pattern: {pattern}
+total_steps: {total_steps}
 created: {today}
 updated: {today}
 tags: [adw, workflow]
@@ -272,42 +278,30 @@ cssclasses: [cards, cards-cover, cards-2-3]
 
 ![[adw-banner.png|banner]]
 
-# {adw['name']}
+# {name}
 
 ## Overview
-{adw['total_steps']}-step AI Developer Workflow.
+{total_steps}-step AI Developer Workflow.
 
 ## Pattern
-> **Type**: `{adw['pattern']}`
-> **Steps**: {adw['total_steps']}
+> **Type**: `{pattern}`
+> **Steps**: {total_steps}
 
 ## Workflow Diagram
 {diagram}
 
 ## Source Files
-- Workflow: `{adw['source_path']}`
+- Workflow: `{source_path}`
 
 ## Changelog
 - {today}: Auto-generated from source repository
 """
 
-    output_path = kb_path / "01-ADWs" / f"{adw['name']}.md"
-    output_path.write_text(content, encoding="utf-8")
-    print(f"Generated: {output_path}")
-
-    return output_path
-
-
-def generate_expert_doc(expert: Dict, kb_path: Path) -> Path:
-    """Generate documentation for an expert."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    overview = expert.get("overview", {})
-
-    content = f"""---
+_EXPERT_TEMPLATE = """---
 type: expert
-name: "{expert['name']}"
+name: "{name}"
 banner: "[[_assets/banners/expert-banner.png]]"
-domain: [{expert['name']}]
+domain: [{name}]
 status: active
 created: {today}
 updated: {today}
@@ -317,26 +311,137 @@ cssclasses: [cards, cards-cover]
 
 ![[expert-banner.png|banner]]
 
-# {expert['name'].title()} Expert
+# {title} Expert
 
 ## Domain Overview
-{overview.get('description', 'No description provided.')}
+{description}
 
 ## Core Insight
-> **Key Insight**: {overview.get('core_insight', 'See expertise file.')}
+> **Key Insight**: {core_insight}
 
 ## Source Files
-- Expertise YAML: `{expert['source_path']}`
+- Expertise YAML: `{source_path}`
 
 ## Changelog
 - {today}: Auto-generated from source repository
 """
 
+# Mermaid workflow diagrams keyed by ADW step count
+_DIAGRAMS = {
+    2: """```mermaid
+graph LR
+    A[Plan] --> B[Build]
+    style A fill:#D97757,color:#fff
+    style B fill:#C26D52,color:#fff
+```""",
+    3: """```mermaid
+graph LR
+    A[Plan] --> B[Build]
+    B --> C[Review]
+    style A fill:#D97757,color:#fff
+    style B fill:#C26D52,color:#fff
+    style C fill:#191919,color:#fff
+```""",
+    4: """```mermaid
+graph LR
+    A[Plan] --> B[Build]
+    B --> C[Review]
+    C --> D[Fix]
+    style A fill:#D97757,color:#fff
+    style B fill:#C26D52,color:#fff
+    style C fill:#191919,color:#fff
+    style D fill:#5C5C5C,color:#fff
+```""",
+}
+
+
+def generate_agent_doc(agent: Dict, kb_path: Path, today: str) -> Tuple[Path, bytes]:
+    """Generate documentation for an agent."""
+    content = _AGENT_TEMPLATE.format_map({
+        "name": agent["name"],
+        "model": agent.get("model", "claude-opus-4-5-20251101"),
+        "tools": agent.get("tools", "[]"),
+        "description": agent.get("description", "No description provided."),
+        "body": agent.get("body", "See source file for full prompt."),
+        "source_path": agent["source_path"],
+        "today": today,
+    })
+
+    output_path = kb_path / "02-Agents" / f"{agent['name']}.md"
+    return output_path, content.encode("utf-8")
+
+
+def generate_adw_doc(adw: Dict, kb_path: Path, today: str) -> Tuple[Path, bytes]:
+    """Generate documentation for an ADW."""
+    content = _ADW_TEMPLATE.format_map({
+        "name": adw["name"],
+        "pattern": adw["pattern"],
+        "total_steps": adw["total_steps"],
+        "diagram": _DIAGRAMS.get(adw["total_steps"], _DIAGRAMS[4]),
+        "source_path": adw["source_path"],
+        "today": today,
+    })
+
+    output_path = kb_path / "01-ADWs" / f"{adw['name']}.md"
+    return output_path, content.encode("utf-8")
+
+
+def generate_expert_doc(expert: Dict, kb_path: Path, today: str) -> Tuple[Path, bytes]:
+    """Generate documentation for an expert."""
+    overview = expert.get("overview", {})
+
+    content = _EXPERT_TEMPLATE.format_map({
+        "name": expert["name"],
+        "title": expert["name"].title(),
+        "description": overview.get("description", "No description provided."),
+        "core_insight": overview.get("core_insight", "See expertise file."),
+        "source_path": expert["source_path"],
+        "today": today,
+    })
+
     output_path = kb_path / "07-Experts" / f"{expert['name']}.md"
-    output_path.write_text(content, encoding="utf-8")
-    print(f"Generated: {output_path}")
+    return output_path, content.encode("utf-8")
+
+
+def _digest(data: bytes) -> str:
+    """Short BLAKE2b digest used to detect unchanged documents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _load_hashes(kb_path: Path) -> Dict[str, str]:
+    """Load the digest cache written by the previous run, if any."""
+    try:
+        return json.loads(_read_text(str(kb_path / HASH_CACHE_FILE)))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_docs(docs: List[Tuple[Path, bytes]], kb_path: Path):
+    """Write pre-encoded documents back-to-back, skipping ones whose content is unchanged."""
+    hashes = _load_hashes(kb_path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for output_path, data in docs:
+        key = output_path.relative_to(kb_path).as_posix()
+        digest = _digest(data)
+        if hashes.get(key) == digest:
+            try:
+                if os.stat(output_path).st_size == len(data):
+                    print(f"Unchanged: {output_path}")
+                    continue
+            except OSError:
+                pass
 
-    return output_path
+        fd = os.open(output_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        hashes[key] = digest
+        print(f"Generated: {output_path}")
+
+    (kb_path / HASH_CACHE_FILE).write_text(json.dumps(hashes, indent=2, sort_keys=True), encoding="utf-8")
 
 
 def generate_dashboard(kb_path: Path):
@@ -347,27 +452,14 @@ def generate_dashboard(kb_path: Path):
     print(f"Generated: {output_path}")
 
 
-def generate_indexes(kb_path: Path):
-    """Generate index pages for each category."""
-    indexes = [
-        ("01-ADWs", "_ADW-Index.md", "adw", "ADW"),
-        ("02-Agents", "_Agent-Index.md", "agent", "Agent"),
-        ("03-Skills", "_Skill-Index.md", "skill", "Skill"),
-        ("04-MCP-Servers", "_MCP-Index.md", "mcp-server", "MCP Server"),
-        ("05-Prompts", "_Prompt-Index.md", "prompt", "Prompt"),
-        ("06-Scripts", "_Script-Index.md", "script", "Script"),
-        ("07-Experts", "_Expert-Index.md", "expert", "Expert"),
-    ]
-
-    for folder, filename, type_name, display_name in indexes:
-        content = f"""---
+_INDEX_TEMPLATE = """---
 type: index
 category: {type_name}
-banner: "[[_assets/banners/{type_name.split('-')[0]}-banner.png]]"
+banner: "[[_assets/banners/{banner_prefix}-banner.png]]"
 cssclasses: [cards, cards-cover, cards-2-3]
 ---
 
-![[{type_name.split('-')[0]}-banner.png|banner]]
+![[{banner_prefix}-banner.png|banner]]
 
 # {display_name} Index
 
@@ -389,6 +481,33 @@ SORT file.mday DESC
 
 [[_Dashboard|<- Back to Dashboard]]
 """
+
+
+_INDEXES = [
+    ("01-ADWs", "_ADW-Index.md", "adw", "ADW"),
+    ("02-Agents", "_Agent-Index.md", "agent", "Agent"),
+    ("03-Skills", "_Skill-Index.md", "skill", "Skill"),
+    ("04-MCP-Servers", "_MCP-Index.md", "mcp-server", "MCP Server"),
+    ("05-Prompts", "_Prompt-Index.md", "prompt", "Prompt"),
+    ("06-Scripts", "_Script-Index.md", "script", "Script"),
+    ("07-Experts", "_Expert-Index.md", "expert", "Expert"),
+]
+
+# Index page content is static, so render all seven once at import
+_INDEX_PAGES = [
+    (folder, filename, _INDEX_TEMPLATE.format(
+        type_name=type_name,
+        banner_prefix=type_name.split('-')[0],
+        folder=folder,
+        display_name=display_name,
+    ))
+    for folder, filename, type_name, display_name in _INDEXES
+]
+
+
+def generate_indexes(kb_path: Path):
+    """Generate index pages for each category."""
+    for folder, filename, content in _INDEX_PAGES:
         output_path = kb_path / folder / filename
         output_path.write_text(content, encoding="utf-8")
         print(f"Generated: {output_path}")
@@ -423,14 +542,25 @@ def main():
     print("=" * 60)
     print(f"Source: {source_repo}")
     print(f"Vault: {obsidian_vault}")
+    if _YLoader is yaml.SafeLoader:
+        print("YAML: pure-Python loader (install libyaml-backed PyYAML for faster parsing)")
+    else:
+        print("YAML: libyaml CSafeLoader")
     print("-" * 60)
 
     # Scan source repository
     print("\nScanning source repository...")
-    agents = scan_agents(source_repo)
-    adws = scan_adw_workflows(source_repo)
-    experts = scan_experts(source_repo)
-    skills = scan_skills(source_repo)
+    # Scans are I/O-bound and independent; file reads share a second pool so
+    # scan tasks never block waiting on their own workers
+    with ThreadPoolExecutor(max_workers=8) as io_pool, ThreadPoolExecutor(max_workers=4) as scan_pool:
+        agents_f = scan_pool.submit(scan_agents, source_repo, io_pool)
+        adws_f = scan_pool.submit(scan_adw_workflows, source_repo)
+        experts_f = scan_pool.submit(scan_experts, source_repo, io_pool)
+        skills_f = scan_pool.submit(scan_skills, source_repo, io_pool)
+        agents = agents_f.result()
+        adws = adws_f.result()
+        experts = experts_f.result()
+        skills = skills_f.result()
 
     print(f"\nFound:")
     print(f"  - {len(agents)} agents")
@@ -449,14 +579,11 @@ def main():
     # Generate documentation
     print("\nGenerating documentation...")
 
-    for agent in agents:
-        generate_agent_doc(agent, kb_path)
-
-    for adw in adws:
-        generate_adw_doc(adw, kb_path)
-
-    for expert in experts:
-        generate_expert_doc(expert, kb_path)
+    today = datetime.now().strftime("%Y-%m-%d")
+    docs = [generate_agent_doc(agent, kb_path, today) for agent in agents]
+    docs.extend(generate_adw_doc(adw, kb_path, today) for adw in adws)
+    docs.extend(generate_expert_doc(expert, kb_path, today) for expert in experts)
+    write_docs(docs, kb_path)
 
     # Generate indexes and dashboard
     print("\nGenerating indexes...")
@@ -0,0 +1,25 @@
+"""Regression tests for scripts/populate_kb.py frontmatter parsing."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from populate_kb import _parse_frontmatter, parse_agent_file  # noqa: E402
+
+
+def test_empty_frontmatter_is_stripped():
+    assert _parse_frontmatter("---\n---\nbody\n") == ({}, "body")
+
+
+def test_empty_frontmatter_does_not_reach_later_fence():
+    assert _parse_frontmatter("---\n---\nbody\n---\nmore") == ({}, "body\n---\nmore")
+
+
+def test_empty_frontmatter_agent_uses_file_name():
+    agent = parse_agent_file("agents/helper.md", "---\n---\nYou are a helper.\n")
+    assert agent["name"] == "helper"
+    assert agent["body"] == "You are a helper."
+
+
+def test_frontmatter_parsed():
+    assert _parse_frontmatter("---\nname: a\n---\nbody\n") == ({"name": "a"}, "body")
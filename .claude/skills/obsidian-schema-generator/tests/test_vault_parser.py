@@ -0,0 +1,71 @@
+"""Regression tests for vault_parser.py."""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vault_parser  # noqa: E402
+
+
+def _run_json(vault, out, monkeypatch):
+    monkeypatch.setattr(sys, "argv", [
+        "vault_parser.py", "--vault-path", str(vault),
+        "--output-format", "json", "--output-dir", str(out),
+    ])
+    vault_parser.main()
+    return json.loads((out / "vault_schema.json").read_text(encoding="utf-8"))
+
+
+def test_json_schema_with_non_str_frontmatter_key(tmp_path, monkeypatch):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "note.md").write_text("---\n1: one\ntitle: Note\n---\nBody\n", encoding="utf-8")
+
+    schema = _run_json(vault, tmp_path / "out", monkeypatch)
+
+    (note,) = schema["notes"]
+    assert note["frontmatter"] == {"1": "one", "title": "Note"}
+
+
+def test_empty_frontmatter_is_stripped(tmp_path):
+    parser = vault_parser.ObsidianVaultParser(str(tmp_path))
+    assert parser.extract_frontmatter("---\n---\nBody #tag\n") == ({}, "Body #tag\n")
+    assert parser.extract_frontmatter("---\n---\nBody\n---\nMore") == ({}, "Body\n---\nMore")
+
+
+def test_json_schema_failure_keeps_previous_file(tmp_path, monkeypatch):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "note.md").write_text("Body\n", encoding="utf-8")
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "vault_schema.json").write_bytes(b'{"previous": true}')
+
+    def boom(self, f, include_content=False):
+        f.write(b'{"partial": ')
+        raise TypeError("unencodable")
+
+    monkeypatch.setattr(vault_parser.ObsidianVaultParser, "write_json_schema", boom)
+    with pytest.raises(TypeError):
+        _run_json(vault, out, monkeypatch)
+
+    assert (out / "vault_schema.json").read_bytes() == b'{"previous": true}'
+    assert [p.name for p in out.iterdir()] == ["vault_schema.json"]
+
+
+def test_frontmatter_fences_with_trailing_whitespace(tmp_path):
+    parser = vault_parser.ObsidianVaultParser(str(tmp_path))
+    assert parser.extract_frontmatter("--- \nfoo: 1\n---\nbody") == ({"foo": 1}, "body")
+    assert parser.extract_frontmatter("---\nfoo: 1\n--- \t\nbody") == ({"foo": 1}, "body")
+    assert parser.extract_frontmatter("---\t\n--- \nbody") == ({}, "body")
+
+
+def test_tags_inside_markdown_link_text_are_kept(tmp_path):
+    parser = vault_parser.ObsidianVaultParser(str(tmp_path))
+    wikilinks, md_links, tags = parser._tokenize("[see #inlink](A/three.md) and #plain [[Note#heading]]")
+    assert md_links == [("A/three.md", "see #inlink")]
+    assert wikilinks == [("Note#heading", "Note#heading")]
+    assert sorted(tags) == ["inlink", "plain"]
@@ -7,19 +7,87 @@ Analyzes an Obsidian vault and generates schemas in multiple formats.
 # requires-python = ">=3.7"
 # dependencies = [
 #   "pyyaml>=6.0",
+#   "xxhash>=3.0",
 # ]
 # ///
 
+import mmap
 import os
 import re
 import json
 import yaml
 import argparse
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
-from typing import Dict, List, Set, Optional, Any
-import hashlib
+from collections import Counter, defaultdict
+from typing import Dict, List, Set, Optional, Any, BinaryIO, TextIO, Union
+import xxhash
+
+try:
+    from yaml import CSafeLoader as _YLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+    HAS_LIBYAML = False
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+# Patterns shared by every note parse
+# Fences may carry trailing spaces/tabs; the inner block is optional (empty frontmatter)
+FRONTMATTER_RE = re.compile(r'\A---[ \t]*\n(?:(.*?)\n)??---[ \t]*(?:\n|\Z)', re.DOTALL)
+WIKILINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')  # [[link]] and [[link|alias]]
+MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+TAG_RE = re.compile(r'#([\w/-]+)')
+# All three token kinds in one alternation so a note body is scanned once
+COMBINED_RE = re.compile(
+    r'(?P<wiki>\[\[([^\]|]+)(?:\|([^\]]+))?\]\])'
+    r'|(?P<mdlink>\[([^\]]+)\]\(([^\)]+\.md)\))'
+    r'|(?P<tag>#([\w/-]+))'
+)
+
+# Notes at least this large are read through mmap instead of a buffered text read
+MMAP_THRESHOLD = 64 * 1024
+
+# Below this many notes, process-pool startup costs more than it saves
+PARALLEL_MIN_NOTES = 500
+
+
+GRAPHML_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+    '  <key id="label" for="node" attr.name="label" attr.type="string"/>\n'
+    '  <key id="path" for="node" attr.name="path" attr.type="string"/>\n'
+    '  <key id="tags" for="node" attr.name="tags" attr.type="string"/>\n'
+    '  <key id="word_count" for="node" attr.name="word_count" attr.type="int"/>\n'
+    '  <graph id="G" edgedefault="directed">\n'
+)
+GRAPHML_NODE = (
+    '    <node id="{id}">\n'
+    '      <data key="label">{label}</data>\n'
+    '      <data key="path">{path}</data>\n'
+    '      <data key="tags">{tags}</data>\n'
+    '      <data key="word_count">{word_count}</data>\n'
+    '    </node>\n'
+)
+GRAPHML_EDGE = '    <edge id="e{i}" source="{source}" target="{target}"/>\n'
+GRAPHML_FOOTER = '  </graph>\n</graphml>'
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode one JSON value as UTF-8, using orjson when it is installed."""
+    if orjson is not None:
+        # YAML frontmatter can carry non-str keys (e.g. ``1: one``), which the
+        # stdlib encoder stringifies; orjson needs this option to do the same
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 
 class ObsidianVaultParser:
@@ -28,23 +96,42 @@ class ObsidianVaultParser:
     def __init__(self, vault_path: str, exclude_folders: Optional[List[str]] = None):
         self.vault_path = Path(vault_path)
         self.exclude_folders = exclude_folders or []
+        self._exclude_set = set(self.exclude_folders)
         self.notes: Dict[str, Dict] = {}
         self.links: List[Dict] = []
         self.folders: Dict[str, Dict] = defaultdict(lambda: {"note_count": 0, "subfolders": set()})
-        self.tag_distribution: Dict[str, int] = defaultdict(int)
-
-    def should_exclude(self, path: Path) -> bool:
-        """Check if path should be excluded from analysis."""
-        # Exclude .obsidian folder and hidden files
-        if any(part.startswith('.') for part in path.parts):
-            return True
-
-        # Exclude user-specified folders
-        for exclude in self.exclude_folders:
-            if exclude in str(path):
-                return True
-
-        return False
+        self.tag_distribution: Counter = Counter()
+        self._title_to_id: Dict[str, str] = {}
+        self._title_to_id_ci: Dict[str, str] = {}
+        # Per-note link counts as parallel arrays, indexed by position in _ids
+        self._ids: List[str] = []
+        self._idx: Dict[str, int] = {}
+        self._in = array('i')
+        self._out = array('i')
+        # Statistics tallied while the link graph is built
+        self._total_out_links = 0
+        self._top: Optional[int] = None
+        self._top_deg = 0
+        self._orphan_ids: List[str] = []
+
+    def _walk(self, root: str, rel_root: str = ''):
+        """Yield (entry, rel_folder) for markdown files, pruning hidden and excluded folders."""
+        with os.scandir(root) as entries:
+            subdirs = []
+            for entry in entries:
+                # Exclude .obsidian folder and hidden files
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    rel_path = f"{rel_root}/{entry.name}" if rel_root else entry.name
+                    # Exclude user-specified folders by name or vault-relative path
+                    if entry.name not in self._exclude_set and rel_path not in self._exclude_set:
+                        subdirs.append((entry.path, rel_path))
+                elif entry.name.endswith('.md') and entry.is_file():
+                    yield entry, rel_root or '.'
+
+        for path, rel_path in subdirs:
+            yield from self._walk(path, rel_path)
 
     def extract_frontmatter(self, content: str) -> tuple[Dict, str]:
         """Extract YAML frontmatter from markdown content."""
@@ -52,36 +139,56 @@ class ObsidianVaultParser:
         body = content
 
         # Check for YAML frontmatter
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                try:
-                    frontmatter = yaml.safe_load(parts[1]) or {}
-                    body = parts[2]
-                except yaml.YAMLError:
-                    pass  # Skip malformed frontmatter
+        match = FRONTMATTER_RE.match(content)
+        if match:
+            try:
+                block = match.group(1)
+                frontmatter = (yaml.load(block, Loader=_YLoader) or {}) if block is not None else {}
+                body = content[match.end():]
+            except yaml.YAMLError:
+                pass  # Skip malformed frontmatter
 
         return frontmatter, body
 
     def extract_wikilinks(self, content: str) -> List[tuple[str, str]]:
         """Extract wikilinks from content. Returns list of (link_target, link_text) tuples."""
-        # Match [[link]] and [[link|alias]]
-        pattern = r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]'
-        matches = re.findall(pattern, content)
+        matches = WIKILINK_RE.findall(content)
 
         # Return (target, display_text)
         return [(match[0], match[1] if match[1] else match[0]) for match in matches]
 
     def extract_markdown_links(self, content: str) -> List[tuple[str, str]]:
         """Extract markdown links. Returns list of (link_target, link_text) tuples."""
-        pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        matches = re.findall(pattern, content)
+        matches = MD_LINK_RE.findall(content)
 
         # Filter for .md files only
         return [(match[1], match[0]) for match in matches if match[1].endswith('.md')]
 
-    def extract_tags(self, content: str, frontmatter: Dict) -> Set[str]:
-        """Extract tags from content and frontmatter."""
+    def _tokenize(self, body: str) -> tuple[List[tuple[str, str]], List[tuple[str, str]], List[str]]:
+        """Extract (wikilinks, markdown_links, content_tags) in a single pass over body."""
+        wikilinks = []
+        md_links = []
+        content_tags = []
+
+        for match in COMBINED_RE.finditer(body):
+            kind = match.lastgroup
+            if kind == 'wiki':
+                target, alias = match.group(2, 3)
+                wikilinks.append((target, alias if alias else target))
+            elif kind == 'mdlink':
+                text = match.group(5)
+                md_links.append((match.group(6), text))
+                # The link consumes its text, so pick up tags written inside it
+                if '#' in text:
+                    content_tags.extend(TAG_RE.findall(text))
+            else:
+                content_tags.append(match.group(8))
+
+        return wikilinks, md_links, content_tags
+
+    def extract_tags(self, content: str, frontmatter: Dict,
+                     content_tags: Optional[List[str]] = None) -> Set[str]:
+        """Extract tags from content and frontmatter; pass content_tags if already tokenized."""
         tags = set()
 
         # From frontmatter
@@ -93,8 +200,8 @@ class ObsidianVaultParser:
                 tags.add(fm_tags)
 
         # From content (#tag format)
-        tag_pattern = r'#([\w/-]+)'
-        content_tags = re.findall(tag_pattern, content)
+        if content_tags is None:
+            content_tags = TAG_RE.findall(content)
         tags.update(content_tags)
 
         return tags
@@ -103,28 +210,36 @@ class ObsidianVaultParser:
         """Generate unique note ID from file path."""
         # Use hash of relative path for consistent IDs
         rel_path = file_path.relative_to(self.vault_path)
-        return hashlib.md5(str(rel_path).encode()).hexdigest()[:12]
+        return xxhash.xxh64_hexdigest(str(rel_path).encode())[:12]
 
-    def parse_note(self, file_path: Path) -> Optional[Dict]:
-        """Parse a single markdown note."""
-        try:
+    def _read_note(self, file_path: Path, size: int) -> str:
+        """Read note text with universal newlines, mapping large files instead of buffering them."""
+        if size < MMAP_THRESHOLD:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                return f.read()
+
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = mm[:].decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
+    def parse_note(self, entry: Union[os.DirEntry, str]) -> Optional[Dict]:
+        """Parse a single markdown note from a scandir entry or file path."""
+        file_path = Path(entry)
+        try:
+            # DirEntry caches stat results from the directory scan where the OS allows
+            stat = entry.stat() if isinstance(entry, os.DirEntry) else file_path.stat()
+            content = self._read_note(file_path, stat.st_size)
         except Exception as e:
             print(f"⚠️  Warning: Could not read {file_path}: {e}")
             return None
 
         frontmatter, body = self.extract_frontmatter(content)
-        wikilinks = self.extract_wikilinks(body)
-        md_links = self.extract_markdown_links(body)
-        tags = self.extract_tags(body, frontmatter)
-
-        # Update tag distribution
-        for tag in tags:
-            self.tag_distribution[tag] += 1
+        wikilinks, md_links, content_tags = self._tokenize(body)
+        tags = self.extract_tags(body, frontmatter, content_tags)
 
         # Get file metadata
-        stat = file_path.stat()
         rel_path = file_path.relative_to(self.vault_path)
 
         note_id = self.generate_note_id(file_path)
@@ -133,14 +248,15 @@ class ObsidianVaultParser:
             "id": note_id,
             "title": file_path.stem,
             "path": str(rel_path),
-            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "created": stat.st_ctime,
+            "modified": stat.st_mtime,
             "size_bytes": stat.st_size,
             "word_count": len(body.split()),
             "tags": sorted(list(tags)),
             "frontmatter": frontmatter,
-            "wikilinks": [{"target": link[0], "text": link[1]} for link in wikilinks],
-            "markdown_links": [{"target": link[0], "text": link[1]} for link in md_links],
+            # Kept as (target, text) tuples in memory; expanded to dicts when emitted
+            "wikilinks": wikilinks,
+            "markdown_links": md_links,
             "outbound_links": [],  # Will be populated later
             "inbound_links": [],   # Will be populated later
         }
@@ -152,22 +268,31 @@ class ObsidianVaultParser:
         print(f"🔍 Scanning vault: {self.vault_path}")
 
         # Find all markdown files
-        md_files = []
-        for md_file in self.vault_path.rglob("*.md"):
-            if not self.should_exclude(md_file):
-                md_files.append(md_file)
+        md_files = list(self._walk(str(self.vault_path)))
 
         print(f"📄 Found {len(md_files)} markdown files")
 
-        # Parse each note
-        for md_file in md_files:
-            note_data = self.parse_note(md_file)
+        # Parse each note; notes are independent, so large vaults fan out across cores
+        if len(md_files) >= PARALLEL_MIN_NOTES and not os.getenv("OBSIDIAN_SCHEMA_SERIAL"):
+            with ProcessPoolExecutor() as executor:
+                parsed = list(executor.map(
+                    _parse_note_worker,
+                    repeat(str(self.vault_path)),
+                    [entry.path for entry, _ in md_files],
+                    chunksize=64,
+                ))
+        else:
+            parsed = [self.parse_note(entry) for entry, _ in md_files]
+
+        for (_, folder), note_data in zip(md_files, parsed):
             if note_data:
                 self.notes[note_data["id"]] = note_data
 
+                # Update tag distribution
+                self.tag_distribution.update(note_data["tags"])
+
                 # Update folder stats
-                folder = md_file.parent.relative_to(self.vault_path)
-                self.folders[str(folder)]["note_count"] += 1
+                self.folders[str(Path(folder))]["note_count"] += 1
 
         print(f"✅ Parsed {len(self.notes)} notes")
 
@@ -181,16 +306,28 @@ class ObsidianVaultParser:
         """Build bidirectional link graph between notes."""
         print("🔗 Building link graph...")
 
-        # Create title to ID mapping for wikilink resolution
-        title_to_id = {note["title"]: note_id for note_id, note in self.notes.items()}
+        # Create title to ID mappings for wikilink resolution, with a
+        # case/whitespace-insensitive fallback for variant spellings
+        self._title_to_id = {note["title"]: note_id for note_id, note in self.notes.items()}
+        self._title_to_id_ci = {
+            title.strip().lower(): note_id for title, note_id in self._title_to_id.items()
+        }
+
+        self._ids = list(self.notes)
+        self._idx = {note_id: i for i, note_id in enumerate(self._ids)}
+        self._in = array('i', [0]) * len(self._ids)
+        self._out = array('i', [0]) * len(self._ids)
+        self._total_out_links = 0
+        # With no links the first note is the most connected, as max() would pick
+        self._top = 0 if self._ids else None
+        self._top_deg = 0
 
         for note_id, note in self.notes.items():
+            source_idx = self._idx[note_id]
             # Process wikilinks
-            for wikilink in note["wikilinks"]:
-                target_title = wikilink["target"]
-
+            for target_title, link_text in note["wikilinks"]:
                 # Try to find target note
-                target_id = title_to_id.get(target_title)
+                target_id = self._resolve_title(target_title)
 
                 if target_id:
                     # Add to outbound links
@@ -199,16 +336,35 @@ class ObsidianVaultParser:
                     # Add to target's inbound links
                     self.notes[target_id]["inbound_links"].append(note_id)
 
+                    target_idx = self._idx[target_id]
+                    self._out[source_idx] += 1
+                    self._in[target_idx] += 1
+                    self._total_out_links += 1
+                    for idx in (source_idx, target_idx):
+                        deg = self._in[idx] + self._out[idx]
+                        # Earliest note wins ties
+                        if deg > self._top_deg or (deg == self._top_deg and idx < self._top):
+                            self._top, self._top_deg = idx, deg
+
                     # Create link record
                     self.links.append({
                         "source": note_id,
                         "target": target_id,
-                        "link_text": wikilink["text"],
+                        "link_text": link_text,
                         "link_type": "wikilink"
                     })
 
+        self._orphan_ids = [
+            note_id for note_id, n_in, n_out in zip(self._ids, self._in, self._out)
+            if n_in == 0 and n_out == 0
+        ]
+
         print(f"✅ Found {len(self.links)} connections")
 
+    def _resolve_title(self, title: str) -> Optional[str]:
+        """Resolve a wikilink target to a note ID, exact match first."""
+        return self._title_to_id.get(title) or self._title_to_id_ci.get(title.strip().lower())
+
     def _analyze_folders(self):
         """Analyze folder hierarchy and relationships."""
         for folder_path in self.folders.keys():
@@ -219,19 +375,11 @@ class ObsidianVaultParser:
 
     def get_statistics(self) -> Dict:
         """Calculate vault statistics."""
-        orphaned_notes = [
-            note_id for note_id, note in self.notes.items()
-            if len(note["inbound_links"]) == 0 and len(note["outbound_links"]) == 0
-        ]
-
-        # Find most connected note
-        most_connected = max(
-            self.notes.items(),
-            key=lambda x: len(x[1]["inbound_links"]) + len(x[1]["outbound_links"]),
-            default=(None, {})
-        )
+        orphaned_notes = self._orphan_ids
+        most_connected_id = self._ids[self._top] if self._top is not None else None
+        most_connected_count = self._top_deg
 
-        total_links = sum(len(note["outbound_links"]) for note in self.notes.values())
+        total_links = self._total_out_links
         avg_links = total_links / len(self.notes) if self.notes else 0
 
         return {
@@ -240,12 +388,12 @@ class ObsidianVaultParser:
             "total_folders": len(self.folders),
             "orphaned_notes": len(orphaned_notes),
             "orphaned_note_ids": orphaned_notes,
-            "most_connected_note": most_connected[1].get("title", "N/A"),
-            "most_connected_note_id": most_connected[0],
-            "most_connected_link_count": len(most_connected[1].get("inbound_links", [])) + len(most_connected[1].get("outbound_links", [])),
+            "most_connected_note": self.notes[most_connected_id]["title"] if most_connected_id else "N/A",
+            "most_connected_note_id": most_connected_id,
+            "most_connected_link_count": most_connected_count,
             "average_links_per_note": round(avg_links, 2),
             "total_tags": len(self.tag_distribution),
-            "tag_distribution": dict(sorted(self.tag_distribution.items(), key=lambda x: x[1], reverse=True)[:20])
+            "tag_distribution": dict(self.tag_distribution.most_common(20))
         }
 
     def generate_json_schema(self, include_content: bool = False) -> Dict:
@@ -253,60 +401,94 @@ class ObsidianVaultParser:
         stats = self.get_statistics()
 
         schema = {
-            "vault_info": {
-                "name": self.vault_path.name,
-                "path": str(self.vault_path),
-                "scanned_at": datetime.now().isoformat(),
-                **stats
-            },
-            "folders": [
-                {
-                    "path": folder_path,
-                    "note_count": data["note_count"],
-                    "subfolder_count": len(data["subfolders"]),
-                    "subfolders": sorted(list(data["subfolders"]))
-                }
-                for folder_path, data in sorted(self.folders.items())
-            ],
-            "notes": list(self.notes.values()),
+            "vault_info": self._vault_info(stats),
+            "folders": self._folder_records(),
+            "notes": [self._note_record(note) for note in self.notes.values()],
             "links": self.links,
             "statistics": stats
         }
 
         return schema
 
+    def write_json_schema(self, f: BinaryIO, include_content: bool = False) -> None:
+        """Stream the JSON schema to a binary file, one note and link per line.
+
+        Produces the same document as ``generate_json_schema`` without
+        materializing the full schema dict first.
+        """
+        stats = self.get_statistics()
+
+        f.write(b'{"vault_info": ')
+        f.write(_json_bytes(self._vault_info(stats)))
+        f.write(b',\n"folders": ')
+        f.write(_json_bytes(self._folder_records()))
+        for key, items in ((b"notes", map(self._note_record, self.notes.values())),
+                           (b"links", self.links)):
+            f.write(b',\n"' + key + b'": [')
+            sep = b'\n'
+            for item in items:
+                f.write(sep)
+                f.write(_json_bytes(item))
+                sep = b',\n'
+            f.write(b'\n]')
+        f.write(b',\n"statistics": ')
+        f.write(_json_bytes(stats))
+        f.write(b'}\n')
+
+    def _vault_info(self, stats: Dict) -> Dict:
+        return {
+            "name": self.vault_path.name,
+            "path": str(self.vault_path),
+            "scanned_at": datetime.now().isoformat(),
+            **stats
+        }
+
+    def _folder_records(self) -> List[Dict]:
+        return [
+            {
+                "path": folder_path,
+                "note_count": data["note_count"],
+                "subfolder_count": len(data["subfolders"]),
+                "subfolders": sorted(list(data["subfolders"]))
+            }
+            for folder_path, data in sorted(self.folders.items())
+        ]
+
+    def _note_record(self, note: Dict) -> Dict:
+        """Expand a note's compact fields (link tuples, epoch timestamps) for emission."""
+        return {
+            **note,
+            "created": datetime.fromtimestamp(note["created"]).isoformat(),
+            "modified": datetime.fromtimestamp(note["modified"]).isoformat(),
+            "wikilinks": [{"target": target, "text": text} for target, text in note["wikilinks"]],
+            "markdown_links": [{"target": target, "text": text} for target, text in note["markdown_links"]],
+        }
+
     def generate_yaml_schema(self) -> str:
         """Generate YAML schema."""
         schema = self.generate_json_schema()
         return yaml.dump(schema, default_flow_style=False, sort_keys=False)
 
-    def generate_graphml(self) -> str:
-        """Generate GraphML format for visualization tools."""
-        xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>']
-        xml_parts.append('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">')
-        xml_parts.append('  <key id="label" for="node" attr.name="label" attr.type="string"/>')
-        xml_parts.append('  <key id="path" for="node" attr.name="path" attr.type="string"/>')
-        xml_parts.append('  <key id="tags" for="node" attr.name="tags" attr.type="string"/>')
-        xml_parts.append('  <key id="word_count" for="node" attr.name="word_count" attr.type="int"/>')
-        xml_parts.append('  <graph id="G" edgedefault="directed">')
+    def write_graphml(self, f: TextIO) -> None:
+        """Stream GraphML format for visualization tools to an open file."""
+        f.write(GRAPHML_HEADER)
 
         # Add nodes
+        escape = self._escape_xml
         for note_id, note in self.notes.items():
-            xml_parts.append(f'    <node id="{note_id}">')
-            xml_parts.append(f'      <data key="label">{self._escape_xml(note["title"])}</data>')
-            xml_parts.append(f'      <data key="path">{self._escape_xml(note["path"])}</data>')
-            xml_parts.append(f'      <data key="tags">{", ".join(note["tags"])}</data>')
-            xml_parts.append(f'      <data key="word_count">{note["word_count"]}</data>')
-            xml_parts.append('    </node>')
+            f.write(GRAPHML_NODE.format(
+                id=note_id,
+                label=escape(note["title"]),
+                path=escape(note["path"]),
+                tags=", ".join(note["tags"]),
+                word_count=note["word_count"],
+            ))
 
         # Add edges
         for i, link in enumerate(self.links):
-            xml_parts.append(f'    <edge id="e{i}" source="{link["source"]}" target="{link["target"]}"/>')
-
-        xml_parts.append('  </graph>')
-        xml_parts.append('</graphml>')
+            f.write(GRAPHML_EDGE.format(i=i, source=link["source"], target=link["target"]))
 
-        return '\n'.join(xml_parts)
+        f.write(GRAPHML_FOOTER)
 
     def _escape_xml(self, text: str) -> str:
         """Escape XML special characters."""
@@ -374,6 +556,17 @@ class ObsidianVaultParser:
         return '\n'.join(report)
 
 
+@lru_cache(maxsize=None)
+def _worker_parser(vault_path: str) -> ObsidianVaultParser:
+    """Per-process parser instance used by pool workers."""
+    return ObsidianVaultParser(vault_path)
+
+
+def _parse_note_worker(vault_path: str, file_path: str) -> Optional[Dict]:
+    """Parse one note in a worker process; module-level so it can be pickled."""
+    return _worker_parser(vault_path).parse_note(file_path)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate schema from Obsidian vault')
     parser.add_argument('--vault-path', required=True, help='Path to Obsidian vault')
@@ -392,6 +585,9 @@ def main():
 
     args = parser.parse_args()
 
+    if not HAS_LIBYAML:
+        print("⚠️  PyYAML was built without libyaml; frontmatter parsing will use the slower pure-Python loader")
+
     # Parse exclude folders
     exclude_folders = [f.strip() for f in args.exclude_folders.split(',') if f.strip()]
 
@@ -408,10 +604,17 @@ def main():
 
     for fmt in formats:
         if fmt == 'json':
-            schema = vault_parser.generate_json_schema(args.include_content)
             output_file = output_dir / 'vault_schema.json'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(schema, f, indent=2, ensure_ascii=False)
+            # Stream into a temp file and swap it in, so an encoding error
+            # cannot leave a truncated schema behind
+            fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix='.vault_schema.', suffix='.json.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    vault_parser.write_json_schema(f, args.include_content)
+                os.replace(tmp_path, output_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             print(f"📄 Generated: {output_file}")
 
         elif fmt == 'yaml':
@@ -422,10 +625,9 @@ def main():
             print(f"📄 Generated: {output_file}")
 
         elif fmt == 'graphml':
-            graphml_content = vault_parser.generate_graphml()
             output_file = output_dir / 'vault_graph.graphml'
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(graphml_content)
+                vault_parser.write_graphml(f)
             print(f"📄 Generated: {output_file}")
 
         elif fmt == 'markdown':
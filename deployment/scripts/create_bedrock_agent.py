@@ -44,6 +44,7 @@ Always use tenant_id from session attributes for context. Provide responses tail
         
         role_name = "BedrockAgentExecutionRole"
         
+        role_created = False
         try:
             role_response = iam.create_role(
                 RoleName=role_name,
@@ -51,6 +52,7 @@ Always use tenant_id from session attributes for context. Provide responses tail
                 Description="Execution role for Bedrock Agent"
             )
             role_arn = role_response['Role']['Arn']
+            role_created = True
             print(f"✅ Created IAM role: {role_arn}")
         except iam.exceptions.EntityAlreadyExistsException:
             role_response = iam.get_role(RoleName=role_name)
@@ -63,17 +65,14 @@ Always use tenant_id from session attributes for context. Provide responses tail
             PolicyArn="arn:aws:iam::aws:policy/AmazonBedrockFullAccess"
         )
         
-        # Wait for IAM role to propagate using exponential backoff
-        max_retries = 5
-        for attempt in range(max_retries):
-            try:
-                iam.get_role(RoleName=role_name)
-                break
-            except Exception:
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    raise
+        # Wait for IAM role to propagate
+        iam.get_waiter('role_exists').wait(
+            RoleName=role_name,
+            WaiterConfig={'Delay': 1, 'MaxAttempts': 10}
+        )
+        if role_created:
+            # IAM is eventually consistent; give Bedrock a moment to see a brand-new role
+            time.sleep(5)
         
         # Create Bedrock Agent
         agent_response = bedrock_agent.create_agent(
@@ -6,6 +6,7 @@ Creates tenant-specific admin groups and assigns users
 
 import boto3
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -42,8 +43,7 @@ def setup_cognito_admin_groups():
     
     print("🔐 Setting up Cognito Admin Groups...")
     
-    # Create groups
-    for group in admin_groups:
+    def create_group(group):
         try:
             cognito_client.create_group(
                 GroupName=group["GroupName"],
@@ -51,11 +51,16 @@ def setup_cognito_admin_groups():
                 Description=group["Description"],
                 Precedence=group["Precedence"]
             )
-            print(f"✅ Created group: {group['GroupName']}")
+            return f"✅ Created group: {group['GroupName']}"
         except cognito_client.exceptions.GroupExistsException:
-            print(f"ℹ️  Group already exists: {group['GroupName']}")
+            return f"ℹ️  Group already exists: {group['GroupName']}"
         except Exception as e:
-            print(f"❌ Error creating group {group['GroupName']}: {e}")
+            return f"❌ Error creating group {group['GroupName']}: {e}"
+    
+    # Create groups in parallel (independent calls); results print in order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for message in executor.map(create_group, admin_groups):
+            print(message)
     
     print("\n📋 Admin Groups Setup Complete!")
     print("\n🔧 To add users to admin groups, use:")
@@ -92,28 +97,43 @@ def list_admin_groups():
     user_pool_id = os.getenv('COGNITO_USER_POOL_ID')
     
     try:
-        # List all groups
-        response = cognito_client.list_groups(UserPoolId=user_pool_id)
+        # List all groups (paginated; a single call stops at 60)
+        groups_paginator = cognito_client.get_paginator('list_groups')
+        admin_groups = [
+            g
+            for page in groups_paginator.paginate(UserPoolId=user_pool_id, PaginationConfig={'PageSize': 60})
+            for g in page['Groups']
+            if g['GroupName'].endswith('-admins')
+        ]
         
-        print("🔐 Admin Groups:")
-        for group in response['Groups']:
-            if group['GroupName'].endswith('-admins'):
-                print(f"\n📋 {group['GroupName']}")
-                print(f"   Description: {group['Description']}")
-                
-                # List users in group
-                users_response = cognito_client.list_users_in_group(
+        def list_group_users(group):
+            users_paginator = cognito_client.get_paginator('list_users_in_group')
+            return [
+                user
+                for page in users_paginator.paginate(
                     UserPoolId=user_pool_id,
-                    GroupName=group['GroupName']
+                    GroupName=group['GroupName'],
+                    PaginationConfig={'PageSize': 60}
                 )
-                
-                if users_response['Users']:
-                    print("   Members:")
-                    for user in users_response['Users']:
-                        email = next((attr['Value'] for attr in user['Attributes'] if attr['Name'] == 'email'), 'No email')
-                        print(f"     - {email}")
-                else:
-                    print("   Members: None")
+                for user in page['Users']
+            ]
+        
+        # Fetch each group's members in parallel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            members = list(executor.map(list_group_users, admin_groups))
+        
+        print("🔐 Admin Groups:")
+        for group, users in zip(admin_groups, members):
+            print(f"\n📋 {group['GroupName']}")
+            print(f"   Description: {group['Description']}")
+            
+            if users:
+                print("   Members:")
+                for user in users:
+                    email = next((attr['Value'] for attr in user['Attributes'] if attr['Name'] == 'email'), 'No email')
+                    print(f"     - {email}")
+            else:
+                print("   Members: None")
         
     except Exception as e:
         print(f"❌ Error listing groups: {e}")
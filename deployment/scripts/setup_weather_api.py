@@ -5,8 +5,10 @@ Helps users configure real-time weather data for MCP tools
 """
 
 import os
+import stat
 import requests
 from typing import Optional
+from dotenv import set_key
 
 def test_weather_api(api_key: str) -> bool:
     """Test if the OpenWeatherMap API key works"""
@@ -44,30 +46,13 @@ def setup_weather_api():
     if test_weather_api(api_key):
         print("✅ API key works! Setting up environment...")
         
-        # Update .env file
+        # Update or add OPENWEATHER_API_KEY in .env (python-dotenv parses the
+        # file, keeps comments/other keys and rewrites via a temp file)
         env_file = ".env"
-        env_content = []
+        open(env_file, 'a', encoding='utf-8').close()
+        set_key(env_file, 'OPENWEATHER_API_KEY', api_key, quote_mode='never')
         
-        # Read existing .env if it exists
-        if os.path.exists(env_file):
-            with open(env_file, 'r', encoding='utf-8') as f:
-                env_content = f.readlines()
-        
-        # Update or add OPENWEATHER_API_KEY
-        updated = False
-        for i, line in enumerate(env_content):
-            if line.startswith('OPENWEATHER_API_KEY='):
-                env_content[i] = f'OPENWEATHER_API_KEY={api_key}\n'
-                updated = True
-                break
-        
-        if not updated:
-            env_content.append(f'OPENWEATHER_API_KEY={api_key}\n')
-        
-        # Write back to .env with restricted permissions (owner read/write only)
-        import stat
-        with open(env_file, 'w', encoding='utf-8') as f:
-            f.writelines(env_content)
+        # Restrict permissions (owner read/write only)
         os.chmod(env_file, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
         
         print(f"✅ API key saved to {env_file}")
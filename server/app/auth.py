@@ -1,48 +1,104 @@
-import boto3
+import jwt
+from jwt import PyJWKClient
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from functools import lru_cache
 from typing import Dict, Optional
+import asyncio
+import hashlib
 import os
-import base64
-import json
+import time
 from app.models import SubscriptionTier
 
 DEV_MODE = os.getenv("DEV_MODE", "false").lower() == "true"
 
 security = HTTPBearer(auto_error=not DEV_MODE)
 
+
+@lru_cache(maxsize=4)
+def _get_jwk_client(region: str, user_pool_id: str) -> PyJWKClient:
+    """One JWKS client per user pool; it caches the key set and refetches on unknown kids."""
+    return PyJWKClient(
+        f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json"
+    )
+
+
+# ── Verified Token Cache (60s TTL, capped at the token's own exp) ─────
+# Key: sha256 of the raw token
+# Value: {"expires": float, "user": dict}
+_token_cache: Dict[str, Dict] = {}
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _copy_user(user: Dict) -> Dict:
+    """Copy a user context, including its mutable groups list."""
+    user = dict(user)
+    if "cognito:groups" in user:
+        user["cognito:groups"] = list(user["cognito:groups"])
+    return user
+
+
+def _token_cache_get(key: str) -> Optional[Dict]:
+    """Return a copy of the cached user context if still fresh, else None."""
+    entry = _token_cache.get(key)
+    if entry is not None:
+        if time.time() < entry["expires"]:
+            return _copy_user(entry["user"])
+        _token_cache.pop(key, None)
+    return None
+
+
+def _token_cache_set(key: str, user: Dict, exp: Optional[float]) -> None:
+    expires = time.time() + TOKEN_CACHE_TTL_SECONDS
+    if exp is not None:
+        expires = min(expires, exp)
+    if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+        # Drop the oldest entry (dicts keep insertion order)
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[key] = {"expires": expires, "user": _copy_user(user)}
+
+
 class CognitoAuth:
     def __init__(self):
         self._cognito_client = None
         self.user_pool_id = os.getenv("COGNITO_USER_POOL_ID")
         self.client_id = os.getenv("COGNITO_CLIENT_ID")
+        self.region = os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))
+        self.issuer = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}"
 
     @property
     def cognito_client(self):
         if self._cognito_client is None:
-            region = os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))
-            self._cognito_client = boto3.client('cognito-idp', region_name=region)
+            import boto3
+            self._cognito_client = boto3.client('cognito-idp', region_name=self.region)
         return self._cognito_client
     
     def verify_token(self, token: str) -> Dict:
         """Verify Cognito JWT token and extract tenant context"""
+        if not self.user_pool_id or not self.client_id:
+            raise HTTPException(status_code=401, detail="Cognito not configured")
+
+        cache_key = _token_cache_key(token)
+        cached = _token_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Decode JWT token without verification (for development)
-            # In production, you should verify the signature with Cognito's public keys
-            parts = token.split('.')
-            if len(parts) != 3:
-                raise HTTPException(status_code=401, detail="Invalid token format")
-            
-            # Decode payload
-            payload_encoded = parts[1]
-            # Add padding if needed
-            payload_encoded += '=' * (4 - len(payload_encoded) % 4)
-            payload_bytes = base64.urlsafe_b64decode(payload_encoded)
-            payload = json.loads(payload_bytes)
-            
-            # Debug: Print actual JWT payload
-            print(f"🔍 Actual JWT Payload: {json.dumps(payload, indent=2)}")
-            
+            # Verify the signature against the pool's cached JWKS
+            signing_key = _get_jwk_client(self.region, self.user_pool_id).get_signing_key_from_jwt(token)
+            payload = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=["RS256"],
+                audience=self.client_id,
+                issuer=self.issuer,
+            )
+
             # Extract tenant_id and subscription_tier from custom attributes
             tenant_id = payload.get("custom:tenant_id")
             subscription_tier = payload.get("custom:subscription_tier", "basic")
@@ -54,7 +110,7 @@ class CognitoAuth:
             if not tenant_id:
                 raise HTTPException(status_code=403, detail="No tenant ID found in token")
             
-            return {
+            user = {
                 "user_id": payload.get("sub"),
                 "tenant_id": tenant_id,
                 "subscription_tier": SubscriptionTier(subscription_tier),
@@ -63,13 +119,23 @@ class CognitoAuth:
                 "role": role,
                 "cognito:groups": user_groups
             }
-            
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
+            _token_cache_set(cache_key, user, payload.get("exp"))
+            return user
+
+        except HTTPException:
+            raise
+        except jwt.ExpiredSignatureError:
+            raise HTTPException(status_code=401, detail="Token expired")
+        except jwt.InvalidTokenError as e:
+            raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
         except Exception as e:
             raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
 
-auth_service = CognitoAuth()
+@lru_cache(maxsize=None)
+def get_auth() -> CognitoAuth:
+    """Process-wide CognitoAuth, built on first use rather than at import."""
+    return CognitoAuth()
+
 
 async def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Dict:
     """Dependency to get current authenticated user with tenant context"""
@@ -85,4 +151,16 @@ async def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] =
         }
     if credentials is None:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    return auth_service.verify_token(credentials.credentials)
\ No newline at end of file
+    token = credentials.credentials
+    cached = _token_cache_get(_token_cache_key(token))
+    if cached is not None:
+        return cached
+    # A cache miss may fetch the JWKS over the network (first request per
+    # worker, unknown kid), so keep the blocking call off the event loop
+    return await asyncio.to_thread(get_auth().verify_token, token)
+
+async def verify_tenant_access(tenant_id: str, current_user: Dict = Depends(get_current_user)) -> Dict:
+    """Dependency for /api/tenants/{tenant_id}/... routes: 403 unless the caller belongs to tenant_id"""
+    if tenant_id != current_user["tenant_id"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return current_user
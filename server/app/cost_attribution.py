@@ -3,6 +3,7 @@ Cost Attribution Service for Multi-Tenant Bedrock Usage
 Calculates costs per tenant and user based on consumption metrics
 """
 
+import asyncio
 from decimal import Decimal
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any
@@ -33,8 +34,8 @@ class CostAttributionService:
         """Calculate total costs for a tenant within date range"""
         
         # Get all usage metrics for tenant
-        usage_metrics = session_store.get_usage_metrics(
-            tenant_id, start_date, end_date
+        usage_metrics = await asyncio.to_thread(
+            session_store.get_usage_metrics, tenant_id, start_date, end_date
         )
         
         total_cost = Decimal("0")
@@ -168,7 +169,7 @@ class CostAttributionService:
             }
         else:
             # Multi-tenant report
-            all_tenants = session_store.get_all_tenants()
+            all_tenants = await asyncio.to_thread(session_store.get_all_tenants)
             tenant_reports = []
             
             total_platform_cost = Decimal("0")
@@ -191,12 +192,7 @@ class CostAttributionService:
                              metric_type: str, value: float, **metadata) -> None:
         """Track usage and calculate real-time cost"""
         
-        # Store usage metric
-        session_store.store_cost_metric(
-            tenant_id, user_id, session_id, metric_type, value, **metadata
-        )
-        
-        # Calculate and store cost attribution
+        # Calculate cost attribution
         cost = Decimal("0")
         
         if metric_type == "bedrock_input_tokens":
@@ -213,12 +209,16 @@ class CostAttributionService:
         elif metric_type == "agent_invocation":
             cost = self.agent_runtime_cost
         
-        # Store cost attribution
+        # Store usage metric and its cost attribution in one batched write
+        metrics = [{"metric_type": metric_type, "value": value, **metadata}]
         if cost > 0:
-            session_store.store_cost_metric(
-                tenant_id, user_id, session_id, f"{metric_type}_cost", float(cost),
-                original_metric=metric_type, **metadata
-            )
+            metrics.append({
+                "metric_type": f"{metric_type}_cost", "value": float(cost),
+                "original_metric": metric_type, **metadata
+            })
+        await asyncio.to_thread(
+            session_store.store_cost_metrics, tenant_id, user_id, session_id, metrics
+        )
 
     async def get_subscription_tier_costs(self, tier: SubscriptionTier, days: int = 30) -> Dict[str, Any]:
         """Get cost breakdown by subscription tier"""
@@ -227,7 +227,7 @@ class CostAttributionService:
         start_date = end_date - timedelta(days=days)
         
         # Get all tenants with this tier
-        tenants_by_tier = session_store.get_tenants_by_tier(tier.value)
+        tenants_by_tier = await asyncio.to_thread(session_store.get_tenants_by_tier, tier.value)
         
         total_cost = Decimal("0")
         tenant_count = 0
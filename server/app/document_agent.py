@@ -14,6 +14,7 @@ import os
 import re
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -632,6 +633,7 @@ def _call_model(user_prompt: str, model: Optional[object] = None) -> str:
             model=model,
             system_prompt=_SYSTEM_PROMPT,
             tools=[],
+            callback_handler=None,  # default handler prints every streamed token
         )
         result = agent(user_prompt)
         # Strands Agent returns an AgentResult; extract text
@@ -641,8 +643,9 @@ def _call_model(user_prompt: str, model: Optional[object] = None) -> str:
         return _direct_model_call(user_prompt, model)
 
 
+@lru_cache(maxsize=1)
 def _get_default_model():
-    """Create a default BedrockModel instance."""
+    """Return the default BedrockModel, created once and reused across calls."""
     from strands.models import BedrockModel
     from botocore.config import Config
 
@@ -17,14 +17,19 @@ else:
     load_dotenv(override=True)
     print(f"[EAGLE STARTUP] No .env found at {_env_path}, using defaults")
 
+from contextlib import asynccontextmanager
+from botocore.exceptions import ClientError
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import asyncio
 import time
 import logging
 import os
 
 from .cognito_auth import extract_user_context
 from .subscription_service import SubscriptionService
+from .stores.session_store import is_throttling_error
 from .streaming_routes import create_streaming_router
 
 # Route modules
@@ -50,12 +55,42 @@ logger = logging.getLogger("eagle")
 # Exporter injection moved to strands_agentic_service._ensure_langfuse_exporter()
 # (must run after Strands sets its global TracerProvider, before first Agent span)
 
+# ── Lifespan ─────────────────────────────────────────────────────────
+# Runs once per uvicorn worker, after fork: build the shared Bedrock model and
+# DynamoDB clients there and open one DynamoDB connection, so the first chat
+# request doesn't pay for client construction and a cold TLS handshake.
+
+def _warm_clients() -> None:
+    from .strands_agentic_service import _get_model
+    from .stores.session_store import _get_dynamodb_client, _get_table
+
+    _get_model()
+    _get_table()
+    _get_dynamodb_client().describe_endpoints()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if os.getenv("EAGLE_WARMUP", "1").lower() in ("1", "true", "yes"):
+        try:
+            await asyncio.to_thread(_warm_clients)
+            logger.info("Warmed Bedrock and DynamoDB clients")
+        except Exception as exc:
+            logger.warning("Client warmup failed (non-fatal): %s", exc)
+    yield
+    from .weather_mcp_service import aclose_http_client
+    await aclose_http_client()
+
+
 # ── App ──────────────────────────────────────────────────────────────
 
 app = FastAPI(
     title="EAGLE – NCI Acquisition Assistant",
     version="4.0.0",
-    description="Multi-tenant acquisition intake system with Anthropic SDK, auth, persistence, and analytics"
+    description="Multi-tenant acquisition intake system with Anthropic SDK, auth, persistence, and analytics",
+    # orjson encodes the (already jsonable_encoder-normalized) bodies several times faster
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # ── CORS Middleware ──────────────────────────────────────────────────
@@ -108,6 +143,19 @@ async def api_request_telemetry(request: Request, call_next):
     return response
 
 
+# ── DynamoDB throttling → 503 ────────────────────────────────────────
+@app.exception_handler(ClientError)
+async def dynamodb_client_error(request: Request, exc: ClientError):
+    if is_throttling_error(exc):
+        return ORJSONResponse(
+            status_code=503,
+            content={"detail": "Service busy, please retry"},
+            headers={"Retry-After": "1"},
+        )
+    logger.error("Unhandled AWS error on %s: %s", request.url.path, exc, exc_info=exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal Server Error"})
+
+
 # ── Initialize services ──────────────────────────────────────────────
 subscription_service = SubscriptionService()
 
@@ -10,7 +10,7 @@ from datetime import datetime
 from fastapi import Header, HTTPException
 
 from ..cognito_auth import UserContext, extract_user_context
-from ..auth import get_current_user  # noqa: F401 — re-exported for routes
+from ..auth import get_current_user, verify_tenant_access  # noqa: F401 — re-exported for routes
 from ..admin_auth import get_admin_user, verify_tenant_admin  # noqa: F401
 
 logger = logging.getLogger("eagle")
@@ -95,9 +95,24 @@ async def api_check_rate_limit(user: UserContext = Depends(get_user_from_header)
 
 # ── KB Review endpoints ───────────────────────────────────────────────
 
+_dynamo = None
+_s3 = None
+
+
 def _get_dynamo():
-    import boto3
-    return boto3.resource("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    global _dynamo
+    if _dynamo is None:
+        import boto3
+        _dynamo = boto3.resource("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    return _dynamo
+
+
+def _get_s3():
+    global _s3
+    if _s3 is None:
+        import boto3
+        _s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    return _s3
 
 
 @router.get("/api/admin/kb-reviews")
@@ -128,14 +143,13 @@ async def api_approve_kb_review(
     user: UserContext = Depends(get_user_from_header),
 ):
     """Approve a KB review: apply diff to matrix.json, update HTML, move doc to approved/."""
-    import boto3
     from botocore.exceptions import ClientError
 
     table_name = os.getenv("METADATA_TABLE", "eagle-document-metadata-dev")
     bucket = S3_BUCKET
     ddb = _get_dynamo()
     table = ddb.Table(table_name)
-    s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    s3 = _get_s3()
 
     pk = f"KB_REVIEW#{review_id}"
     try:
@@ -190,14 +204,13 @@ async def api_reject_kb_review(
     user: UserContext = Depends(get_user_from_header),
 ):
     """Reject a KB review: mark rejected, move doc to rejected/."""
-    import boto3
     from botocore.exceptions import ClientError
 
     table_name = os.getenv("METADATA_TABLE", "eagle-document-metadata-dev")
     bucket = S3_BUCKET
     ddb = _get_dynamo()
     table = ddb.Table(table_name)
-    s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    s3 = _get_s3()
 
     pk = f"KB_REVIEW#{review_id}"
     try:
@@ -1,5 +1,6 @@
 """REST chat endpoint — EAGLE Anthropic/Strands SDK."""
 
+import asyncio
 import time
 import logging
 from typing import Optional, Dict, List, Any
@@ -122,27 +123,28 @@ async def api_chat(req: EagleChatRequest, user: UserContext = Depends(get_user_f
         _response_text = "".join(_text_parts) or _final_text
         result = {"text": _response_text, "usage": _usage, "model": MODEL, "tools_called": _tools_called}
 
-        # Store response
-        if USE_PERSISTENT_SESSIONS:
-            add_message(session_id, "assistant", result["text"], tenant_id, user_id)
-        else:
-            messages.append({"role": "assistant", "content": result["text"]})
-
         elapsed_ms = int((time.time() - start) * 1000)
         usage = result.get("usage", {})
 
-        # Calculate and record cost
+        # Calculate cost
         input_tokens = usage.get("input_tokens", 0)
         output_tokens = usage.get("output_tokens", 0)
         cost = calculate_cost(input_tokens, output_tokens)
 
-        record_request_cost(
+        # Store response and record cost — independent DynamoDB writes, run concurrently
+        writes = [asyncio.to_thread(
+            record_request_cost,
             tenant_id, user_id, session_id,
             input_tokens, output_tokens,
             model=result.get("model", MODEL),
             tools_used=result.get("tools_called", []),
             response_time_ms=elapsed_ms
-        )
+        )]
+        if USE_PERSISTENT_SESSIONS:
+            writes.append(asyncio.to_thread(add_message, session_id, "assistant", result["text"], tenant_id, user_id))
+        else:
+            messages.append({"role": "assistant", "content": result["text"]})
+        await asyncio.gather(*writes)
 
         log_telemetry({
             "event": "chat_request",
@@ -106,10 +106,21 @@ async def api_export_session(
 
 # ── S3 Document Browser ──────────────────────────────────────────────
 
+_s3 = None
+
+
+def _get_s3():
+    """Shared S3 client, created on first use instead of per request."""
+    global _s3
+    if _s3 is None:
+        import boto3
+        _s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    return _s3
+
+
 @router.get("/api/documents")
 async def api_list_documents(user: UserContext = Depends(get_user_from_header)):
     """List documents in S3 for the current user."""
-    import boto3
     from botocore.exceptions import ClientError
 
     tenant_id = user.tenant_id
@@ -118,7 +129,7 @@ async def api_list_documents(user: UserContext = Depends(get_user_from_header)):
     prefix = f"eagle/{tenant_id}/{user_id}/"
 
     try:
-        s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+        s3 = _get_s3()
         response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=100)
 
         documents = []
@@ -144,7 +155,6 @@ async def api_list_documents(user: UserContext = Depends(get_user_from_header)):
 @router.get("/api/documents/{doc_key:path}")
 async def api_get_document(doc_key: str, user: UserContext = Depends(get_user_from_header)):
     """Get document content from S3."""
-    import boto3
     from botocore.exceptions import ClientError
 
     tenant_id = user.tenant_id
@@ -156,7 +166,7 @@ async def api_get_document(doc_key: str, user: UserContext = Depends(get_user_fr
         raise HTTPException(status_code=403, detail="Access denied")
 
     try:
-        s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+        s3 = _get_s3()
         response = s3.get_object(Bucket=bucket, Key=doc_key)
         content = response["Body"].read().decode("utf-8", errors="replace")
 
@@ -187,7 +197,6 @@ async def api_update_document(
     For package documents (eagle/{tenant}/packages/...), creates a new version.
     For workspace documents, performs a direct overwrite.
     """
-    import boto3
     from botocore.exceptions import ClientError
 
     tenant_id = user.tenant_id
@@ -237,7 +246,7 @@ async def api_update_document(
         }
     else:
         try:
-            s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+            s3 = _get_s3()
             s3.put_object(
                 Bucket=bucket,
                 Key=doc_key,
@@ -262,7 +271,6 @@ async def api_presign_document(
     user: UserContext = Depends(get_user_from_header),
 ):
     """Generate a time-limited presigned URL for an S3 document."""
-    import boto3
     from botocore.exceptions import ClientError
 
     tenant_id = user.tenant_id
@@ -273,7 +281,7 @@ async def api_presign_document(
 
     bucket = S3_BUCKET
     try:
-        s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+        s3 = _get_s3()
         url = s3.generate_presigned_url(
             "get_object",
             Params={"Bucket": bucket, "Key": key},
@@ -301,7 +309,6 @@ async def api_upload_document(
     user: UserContext = Depends(get_user_from_header),
 ):
     """Upload a document to the user's S3 workspace and trigger metadata extraction."""
-    import boto3
     from botocore.exceptions import ClientError
     import re
 
@@ -324,7 +331,7 @@ async def api_upload_document(
     key = f"eagle/{tenant_id}/{user_id}/uploads/{safe_name}"
 
     try:
-        s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+        s3 = _get_s3()
         s3.put_object(Bucket=bucket, Key=key, Body=body, ContentType=content_type)
     except ClientError as e:
         logger.error("S3 upload error: %s", e, exc_info=True)
@@ -1,11 +1,13 @@
 """Tenant usage, costs, subscription, analytics, and weather MCP endpoints."""
 
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from ..auth import get_current_user
+from ..auth import get_current_user, verify_tenant_access
 from ..subscription_service import SubscriptionService
 from ..cost_attribution import CostAttributionService
 from ..stores.session_store import get_tenant_usage_overview, list_tenant_sessions
@@ -21,18 +23,14 @@ cost_service = CostAttributionService()
 # ── Tenant usage & cost endpoints ─────────────────────────────────────
 
 @router.get("/api/tenants/{tenant_id}/usage")
-async def get_tenant_usage(tenant_id: str, current_user: dict = Depends(get_current_user)):
+async def get_tenant_usage(tenant_id: str, current_user: dict = Depends(verify_tenant_access)):
     """Get usage metrics for authenticated tenant"""
-    if tenant_id != current_user["tenant_id"]:
-        raise HTTPException(status_code=403, detail="Access denied")
-    return get_tenant_usage_overview(tenant_id)
+    return await asyncio.to_thread(get_tenant_usage_overview, tenant_id)
 
 
 @router.get("/api/tenants/{tenant_id}/costs")
-async def get_tenant_costs(tenant_id: str, days: int = 30, current_user: dict = Depends(get_current_user)):
+async def get_tenant_costs(tenant_id: str, days: int = 30, current_user: dict = Depends(verify_tenant_access)):
     """Get cost attribution for tenant"""
-    if tenant_id != current_user["tenant_id"]:
-        raise HTTPException(status_code=403, detail="Access denied")
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     costs = await cost_service.calculate_tenant_costs(tenant_id, start_date, end_date)
@@ -40,9 +38,9 @@ async def get_tenant_costs(tenant_id: str, days: int = 30, current_user: dict =
 
 
 @router.get("/api/tenants/{tenant_id}/users/{user_id}/costs")
-async def get_user_costs(tenant_id: str, user_id: str, days: int = 30, current_user: dict = Depends(get_current_user)):
+async def get_user_costs(tenant_id: str, user_id: str, days: int = 30, current_user: dict = Depends(verify_tenant_access)):
     """Get cost attribution for specific user"""
-    if tenant_id != current_user["tenant_id"] or user_id != current_user["user_id"]:
+    if user_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
@@ -51,14 +49,13 @@ async def get_user_costs(tenant_id: str, user_id: str, days: int = 30, current_u
 
 
 @router.get("/api/tenants/{tenant_id}/subscription")
-async def get_subscription_info(tenant_id: str, current_user: dict = Depends(get_current_user)):
+async def get_subscription_info(tenant_id: str, current_user: dict = Depends(verify_tenant_access)):
     """Get subscription tier information and usage limits"""
-    if tenant_id != current_user["tenant_id"]:
-        raise HTTPException(status_code=403, detail="Access denied")
     tier = current_user["subscription_tier"]
     limits = subscription_service.get_tier_limits(tier)
+    # One usage read serves both current_usage and limit_status
     usage = await subscription_service.get_usage(tenant_id, tier)
-    usage_limits = await subscription_service.check_usage_limits(tenant_id, tier)
+    usage_limits = subscription_service.usage_limit_status(usage, tier)
     return {
         "tenant_id": tenant_id,
         "subscription_tier": tier.value,
@@ -69,31 +66,29 @@ async def get_subscription_info(tenant_id: str, current_user: dict = Depends(get
 
 
 @router.get("/api/tenants/{tenant_id}/sessions")
-async def get_tenant_sessions(tenant_id: str, current_user: dict = Depends(get_current_user)):
+async def get_tenant_sessions(tenant_id: str, current_user: dict = Depends(verify_tenant_access)):
     """Get all sessions for authenticated tenant"""
-    if tenant_id != current_user["tenant_id"]:
-        raise HTTPException(status_code=403, detail="Access denied")
     return {
         "tenant_id": tenant_id,
-        "sessions": list_tenant_sessions(tenant_id)
+        "sessions": await asyncio.to_thread(list_tenant_sessions, tenant_id)
     }
 
 
 @router.get("/api/tenants/{tenant_id}/analytics")
-async def get_tenant_analytics(tenant_id: str, current_user: dict = Depends(get_current_user)):
+async def get_tenant_analytics(tenant_id: str, current_user: dict = Depends(verify_tenant_access)):
     """Get enhanced analytics with trace data for authenticated tenant"""
-    if tenant_id != current_user["tenant_id"]:
-        raise HTTPException(status_code=403, detail="Access denied")
-    usage_data = get_tenant_usage_overview(tenant_id)
+    usage_data = await asyncio.to_thread(get_tenant_usage_overview, tenant_id)
     tier = current_user["subscription_tier"]
+    limits = subscription_service.get_tier_limits(tier)
+    metric_counts = Counter(m.get("metric_type") for m in usage_data.get("metrics", []))
     analytics = {
         "tenant_id": tenant_id,
         "subscription_tier": tier.value,
         "total_interactions": usage_data.get("total_messages", 0),
         "active_sessions": usage_data.get("sessions", 0),
         "processing_patterns": {
-            "agent_invocations": len([m for m in usage_data.get("metrics", []) if m.get("metric_type") == "agent_invocation"]),
-            "trace_analyses": len([m for m in usage_data.get("metrics", []) if m.get("metric_type") == "trace_analysis"])
+            "agent_invocations": metric_counts["agent_invocation"],
+            "trace_analyses": metric_counts["trace_analysis"]
         },
         "resource_breakdown": {
             "model_invocations": usage_data.get("total_messages", 0),
@@ -101,21 +96,32 @@ async def get_tenant_analytics(tenant_id: str, current_user: dict = Depends(get_
             "action_group_calls": 0
         },
         "tier_specific_metrics": {
-            "mcp_tools_available": subscription_service.get_tier_limits(tier).mcp_server_access,
-            "usage_limits": subscription_service.get_tier_limits(tier).dict()
+            "mcp_tools_available": limits.mcp_server_access,
+            "usage_limits": limits.dict()
         }
     }
     return analytics
 
 
 # ── Weather MCP endpoints (compatibility) ─────────────────────────────
+# One client per process; its tool table is static, so there is nothing to
+# rebuild per request.
+_weather_client = None
+
+
+def _get_weather_client():
+    global _weather_client
+    if _weather_client is None:
+        from ..weather_mcp_service import WeatherMCPClient
+        _weather_client = WeatherMCPClient()
+    return _weather_client
+
 
 @router.get("/api/mcp/weather/tools")
 async def get_available_weather_tools(current_user: dict = Depends(get_current_user)):
     """Get available weather MCP tools for current subscription tier"""
     try:
-        from ..weather_mcp_service import WeatherMCPClient
-        weather_client = WeatherMCPClient()
+        weather_client = _get_weather_client()
         tier = current_user["subscription_tier"]
         weather_tools = await weather_client.get_available_weather_tools(tier)
         return {"subscription_tier": tier.value, "weather_tools": weather_tools}
@@ -127,8 +133,7 @@ async def get_available_weather_tools(current_user: dict = Depends(get_current_u
 async def execute_weather_mcp_tool(tool_name: str, arguments: dict, current_user: dict = Depends(get_current_user)):
     """Execute weather MCP tool if subscription tier allows it"""
     try:
-        from ..weather_mcp_service import WeatherMCPClient
-        weather_client = WeatherMCPClient()
+        weather_client = _get_weather_client()
         tier = current_user["subscription_tier"]
         result = await weather_client.execute_weather_tool(tool_name, arguments, tier)
         return {"tool_name": tool_name, "subscription_tier": tier.value, "result": result}
@@ -39,12 +39,12 @@ def _build_story(observations: list) -> list[dict]:
         pid = o.get("parentObservationId")
         if pid:
             children_map.setdefault(pid, []).append(o)
+    # Sort each sibling list once; kids() then only filters (sort is stable).
+    for siblings in children_map.values():
+        siblings.sort(key=lambda x: x.get("startTime", ""))
 
     def kids(oid: str, typ_prefix: str) -> list:
-        return sorted(
-            [c for c in children_map.get(oid, []) if (c.get("type") or "").startswith(typ_prefix)],
-            key=lambda x: x.get("startTime", ""),
-        )
+        return [c for c in children_map.get(oid, []) if (c.get("type") or "").startswith(typ_prefix)]
 
     def direct_gen(oid: str):
         gs = kids(oid, "GEN")
@@ -94,6 +94,7 @@ def _build_story(observations: list) -> list[dict]:
 
         turn_num += 1
         resp_blocks = parse_resp_blocks(gen)
+        tool_spans = kids(cycle["id"], "TOOL")
 
         tool_names = []
         tool_details = []
@@ -108,7 +109,7 @@ def _build_story(observations: list) -> list[dict]:
 
         # Attach tool results from TOOL observation spans
         for td in tool_details:
-            for ts in kids(cycle["id"], "TOOL"):
+            for ts in tool_spans:
                 if ts.get("name") == td["name"]:
                     raw_out = ts.get("output") or {}
                     if isinstance(raw_out, str):
@@ -138,7 +139,7 @@ def _build_story(observations: list) -> list[dict]:
         }
 
         # Walk TOOL spans for subagent invocations
-        for ts in kids(cycle["id"], "TOOL"):
+        for ts in tool_spans:
             sub_agens = kids(ts["id"], "AGEN")
             if not sub_agens:
                 continue
@@ -258,10 +259,13 @@ async def get_trace_story(session_id: str = Query(..., description="Session ID t
 
     story = _build_story(observations)
 
-    total_in = sum(t["input_tokens"] for t in story)
-    total_out = sum(t["output_tokens"] for t in story)
-    total_sub_in = sum(s["input_tokens"] for t in story for s in t["subagents"])
-    total_sub_out = sum(s["output_tokens"] for t in story for s in t["subagents"])
+    total_in = total_out = total_sub_in = total_sub_out = 0
+    for t in story:
+        total_in += t["input_tokens"]
+        total_out += t["output_tokens"]
+        for s in t["subagents"]:
+            total_sub_in += s["input_tokens"]
+            total_sub_out += s["output_tokens"]
 
     return {
         "trace_id": trace_id,
@@ -89,26 +89,20 @@ def get_plugin_item(entity_type: str, name: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def put_plugin_item(
+def _build_plugin_item(
     entity_type: str,
     name: str,
     content: str,
-    metadata: Optional[Dict[str, Any]] = None,
-    content_type: str = "markdown",
+    metadata: Optional[Dict[str, Any]],
+    content_type: str,
+    existing: Optional[Dict[str, Any]],
+    now: str,
 ) -> Dict[str, Any]:
-    """Upsert a PLUGIN# item.
-
-    If the item already exists, version is incremented and updated_at is refreshed.
-    Returns the written item dict.
-    """
-    now = datetime.utcnow().isoformat()
-
-    # Fetch existing to preserve version and created_at
-    existing = get_plugin_item(entity_type, name)
+    """Build a PLUGIN# item, bumping version and keeping created_at from existing."""
     version = (existing.get("version", 0) + 1) if existing else 1
     created_at = existing.get("created_at", now) if existing else now
 
-    item: Dict[str, Any] = {
+    return {
         "PK": f"PLUGIN#{entity_type}",
         "SK": f"PLUGIN#{name}",
         "entity_type": entity_type,
@@ -122,17 +116,86 @@ def put_plugin_item(
         "updated_at": now,
     }
 
+
+def put_plugin_item(
+    entity_type: str,
+    name: str,
+    content: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    content_type: str = "markdown",
+) -> Dict[str, Any]:
+    """Upsert a PLUGIN# item.
+
+    If the item already exists, version is incremented and updated_at is refreshed.
+    Returns the written item dict.
+    """
+    now = datetime.utcnow().isoformat()
+
+    # Fetch existing to preserve version and created_at
+    existing = get_plugin_item(entity_type, name)
+    item = _build_plugin_item(entity_type, name, content, metadata, content_type, existing, now)
+
     try:
         table = _get_table()
         table.put_item(Item=item)
         _cache_invalidate(entity_type)
-        logger.debug("plugin_store.put_plugin_item: [%s/%s] v%s", entity_type, name, version)
+        logger.debug("plugin_store.put_plugin_item: [%s/%s] v%s", entity_type, name, item["version"])
     except (ClientError, BotoCoreError) as e:
         logger.error("plugin_store.put_plugin_item failed [%s/%s]: %s", entity_type, name, e)
 
     return item
 
 
+def put_plugin_items(entity_type: str, entries: List[Dict[str, Any]]) -> int:
+    """Upsert many PLUGIN# items of one entity_type with batched writes.
+
+    Each entry is a dict with name, content and optional metadata/content_type.
+    Existing versions come from one paginated query rather than a get per item,
+    and writes go out as 25-item BatchWriteItem calls. Returns the number written.
+    """
+    if not entries:
+        return 0
+
+    now = datetime.utcnow().isoformat()
+    try:
+        table = _get_table()
+        existing: Dict[str, Dict[str, Any]] = {}
+        query_kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+            "ExpressionAttributeValues": {
+                ":pk": f"PLUGIN#{entity_type}",
+                ":sk_prefix": "PLUGIN#",
+            },
+            "ProjectionExpression": "#n, version, created_at",
+            "ExpressionAttributeNames": {"#n": "name"},
+        }
+        while True:
+            response = table.query(**query_kwargs)
+            for i in response.get("Items", []):
+                existing[i.get("name")] = i
+            if "LastEvaluatedKey" not in response:
+                break
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for entry in entries:
+                batch.put_item(Item=_build_plugin_item(
+                    entity_type,
+                    entry["name"],
+                    entry.get("content", ""),
+                    entry.get("metadata"),
+                    entry.get("content_type", "markdown"),
+                    existing.get(entry["name"]),
+                    now,
+                ))
+        _cache_invalidate(entity_type)
+        logger.debug("plugin_store.put_plugin_items: [%s] %d items", entity_type, len(entries))
+        return len(entries)
+    except (ClientError, BotoCoreError) as e:
+        logger.error("plugin_store.put_plugin_items failed [%s]: %s", entity_type, e)
+        return 0
+
+
 def list_plugin_entities(entity_type: str) -> List[Dict[str, Any]]:
     """Return all PLUGIN# items for the given entity_type.
 
@@ -236,34 +299,14 @@ def ensure_plugin_seeded() -> None:
     # at its tail end, so by the time ensure_plugin_seeded() runs, AGENTS/SKILLS are loaded.
     from eagle_skill_constants import AGENTS, SKILLS  # type: ignore[import]
 
-    seeded_agents = 0
-    seeded_skills = 0
-
-    for agent_name, entry in AGENTS.items():
-        try:
-            put_plugin_item(
-                entity_type="agents",
-                name=agent_name,
-                content=entry.get("body", ""),
-                metadata=entry.get("meta", {}),
-                content_type="markdown",
-            )
-            seeded_agents += 1
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("plugin_store: failed to seed agent [%s]: %s", agent_name, exc)
-
-    for skill_name, entry in SKILLS.items():
-        try:
-            put_plugin_item(
-                entity_type="skills",
-                name=skill_name,
-                content=entry.get("body", ""),
-                metadata=entry.get("meta", {}),
-                content_type="markdown",
-            )
-            seeded_skills += 1
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("plugin_store: failed to seed skill [%s]: %s", skill_name, exc)
+    seeded_agents = put_plugin_items("agents", [
+        {"name": agent_name, "content": entry.get("body", ""), "metadata": entry.get("meta", {})}
+        for agent_name, entry in AGENTS.items()
+    ])
+    seeded_skills = put_plugin_items("skills", [
+        {"name": skill_name, "content": entry.get("body", ""), "metadata": entry.get("meta", {})}
+        for skill_name, entry in SKILLS.items()
+    ])
 
     # Write manifest last — marks seeding as complete
     manifest_content = json.dumps({
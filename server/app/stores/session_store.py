@@ -13,6 +13,8 @@ from decimal import Decimal
 
 import boto3
 from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
 
 logger = logging.getLogger("eagle.sessions")
@@ -23,20 +25,68 @@ AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 SESSION_TTL_DAYS = int(os.getenv("SESSION_TTL_DAYS", "30"))
 
 # ── DynamoDB Client ──────────────────────────────────────────────────
+# Every chat request reads and writes this table: keep connections warm,
+# size the pool for concurrent requests, and fail fast on a dead endpoint.
+_dynamodb_config = Config(
+    connect_timeout=3,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+)
 _dynamodb = None
+_dynamodb_client = None
 
 
 def _get_dynamodb():
     global _dynamodb
     if _dynamodb is None:
-        _dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
+        _dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION, config=_dynamodb_config)
     return _dynamodb
 
 
+def _get_dynamodb_client():
+    """Low-level client for the per-message write path.
+
+    The resource's own meta.client has the Table type-conversion hooks
+    registered on it, so pre-typed values need a separate plain client.
+    """
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client("dynamodb", region_name=AWS_REGION, config=_dynamodb_config)
+    return _dynamodb_client
+
+
+_serialize_attr = TypeSerializer().serialize
+
+# add_message bumps the session counter on every message; the expression and
+# its constant operands are already in wire format.
+_MESSAGE_COUNT_UPDATE = "SET #upd = :upd, message_count = if_not_exists(message_count, :zero) + :one"
+_MESSAGE_COUNT_NAMES = {"#upd": "updated_at"}
+_ZERO = {"N": "0"}
+_ONE = {"N": "1"}
+
+
 def _get_table():
     return _get_dynamodb().Table(TABLE_NAME)
 
 
+# Throttling that survives the client's adaptive retries is surfaced to the
+# caller (main.py maps it to 503) instead of being reported as "not found".
+THROTTLING_ERROR_CODES = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+})
+
+
+def is_throttling_error(exc: Exception) -> bool:
+    return (
+        isinstance(exc, ClientError)
+        and exc.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+    )
+
+
 # ── In-Memory Cache ──────────────────────────────────────────────────
 # Local cache for fast reads, with write-through to DynamoDB
 _session_cache: Dict[str, Dict] = {}
@@ -173,6 +223,8 @@ def get_session(
         # Return cached if available
         if session_id in _session_cache:
             return _serialize_item(_session_cache[session_id])
+        if is_throttling_error(e):
+            raise
         return None
 
 
@@ -342,22 +394,31 @@ def add_message(
     }
 
     try:
-        table = _get_table()
-        table.put_item(Item=message)
+        client = _get_dynamodb_client()
+        pk = {"S": message["PK"]}
+        created_at = {"S": message["created_at"]}
+        client.put_item(
+            TableName=TABLE_NAME,
+            Item={
+                "PK": pk,
+                "SK": {"S": message["SK"]},
+                "message_id": {"S": message_id},
+                "session_id": {"S": session_id},
+                "role": {"S": role},
+                "content": {"S": content_str},
+                "content_type": {"S": message["content_type"]},
+                "created_at": created_at,
+                "metadata": _serialize_attr(message["metadata"]),
+            },
+        )
 
         # Update session message count and updated_at
-        table.update_item(
-            Key={
-                "PK": f"SESSION#{tenant_id}#{user_id}",
-                "SK": f"SESSION#{session_id}",
-            },
-            UpdateExpression="SET #upd = :upd, message_count = if_not_exists(message_count, :zero) + :one",
-            ExpressionAttributeNames={"#upd": "updated_at"},
-            ExpressionAttributeValues={
-                ":upd": now.isoformat(),
-                ":zero": 0,
-                ":one": 1,
-            }
+        client.update_item(
+            TableName=TABLE_NAME,
+            Key={"PK": pk, "SK": {"S": f"SESSION#{session_id}"}},
+            UpdateExpression=_MESSAGE_COUNT_UPDATE,
+            ExpressionAttributeNames=_MESSAGE_COUNT_NAMES,
+            ExpressionAttributeValues={":upd": created_at, ":zero": _ZERO, ":one": _ONE},
         )
 
         return _serialize_item(message)
@@ -441,7 +502,7 @@ def load_agent_state(
             return None
         content = item.get("content", "{}")
         return json.loads(content) if isinstance(content, str) else content
-    except Exception as exc:
+    except (ClientError, BotoCoreError, ValueError) as exc:
         logger.warning("Failed to load agent state for %s: %s", session_id, exc)
         return None
 
@@ -468,7 +529,7 @@ def save_agent_state(
             "updated_at": now,
             "ttl": ttl,
         })
-    except Exception as exc:
+    except (ClientError, BotoCoreError, TypeError, ValueError) as exc:
         logger.warning("Failed to save agent state for %s: %s", session_id, exc)
 
 
@@ -702,19 +763,19 @@ def get_tenants_by_tier(tier: str) -> List[Dict[str, str]]:
         return []
 
 
-def store_cost_metric(
+def _cost_metric_item(
     tenant_id: str,
     user_id: str,
     session_id: str,
     metric_type: str,
     value: float,
+    now: datetime,
     **metadata
-) -> None:
-    """Store a cost/usage metric in the eagle table."""
-    now = datetime.utcnow()
-    item = {
+) -> Dict[str, Any]:
+    """Build a COST# item; metric_type in the SK keeps same-millisecond metrics distinct."""
+    return {
         "PK": f"COST#{tenant_id}",
-        "SK": f"COST#{now.strftime('%Y-%m-%d')}#{int(now.timestamp() * 1000)}",
+        "SK": f"COST#{now.strftime('%Y-%m-%d')}#{int(now.timestamp() * 1000)}#{metric_type}",
         "tenant_id": tenant_id,
         "user_id": user_id,
         "session_id": session_id,
@@ -724,6 +785,20 @@ def store_cost_metric(
         "created_at": now.isoformat(),
         **{k: v for k, v in metadata.items()},
     }
+
+
+def store_cost_metric(
+    tenant_id: str,
+    user_id: str,
+    session_id: str,
+    metric_type: str,
+    value: float,
+    **metadata
+) -> None:
+    """Store a cost/usage metric in the eagle table."""
+    item = _cost_metric_item(
+        tenant_id, user_id, session_id, metric_type, value, datetime.utcnow(), **metadata
+    )
     try:
         table = _get_table()
         table.put_item(Item=item)
@@ -731,6 +806,26 @@ def store_cost_metric(
         logger.error("Failed to store cost metric: %s", e)
 
 
+def store_cost_metrics(
+    tenant_id: str,
+    user_id: str,
+    session_id: str,
+    metrics: List[Dict[str, Any]]
+) -> None:
+    """Store several cost/usage metrics with one BatchWriteItem round-trip.
+
+    Each metric is a dict with metric_type, value and any extra attributes.
+    """
+    now = datetime.utcnow()
+    try:
+        table = _get_table()
+        with table.batch_writer() as batch:
+            for metric in metrics:
+                batch.put_item(Item=_cost_metric_item(tenant_id, user_id, session_id, now=now, **metric))
+    except (ClientError, BotoCoreError) as e:
+        logger.error("Failed to store cost metrics: %s", e)
+
+
 def get_tenant_usage_overview(tenant_id: str) -> Dict[str, Any]:
     """Get tenant usage overview (replaces DynamoDBStore.get_tenant_usage).
 
@@ -765,6 +860,8 @@ def get_tenant_usage_overview(tenant_id: str) -> Dict[str, Any]:
         }
     except (ClientError, BotoCoreError) as e:
         logger.error("Failed to get tenant usage overview: %s", e)
+        if is_throttling_error(e):
+            raise
         return {
             "tenant_id": tenant_id,
             "total_messages": 0,
@@ -790,6 +887,8 @@ def list_tenant_sessions(tenant_id: str) -> List[Dict[str, Any]]:
         return [_serialize_item(i) for i in response.get("Items", [])]
     except (ClientError, BotoCoreError) as e:
         logger.error("Failed to list tenant sessions: %s", e)
+        if is_throttling_error(e):
+            raise
         return []
 
 
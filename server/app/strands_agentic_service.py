@@ -29,9 +29,11 @@ import re
 import sys
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, AsyncGenerator
 
 import boto3
+import orjson
 
 from botocore.config import Config
 from strands import Agent, tool
@@ -509,6 +511,7 @@ _bedrock_client_config = Config(
         "mode": os.getenv("EAGLE_BEDROCK_RETRY_MODE", "adaptive"),
     },
     tcp_keepalive=True,
+    max_pool_connections=int(os.getenv("EAGLE_BEDROCK_MAX_POOL_CONNECTIONS", "50")),
 )
 
 # -- Model factory (lazy singleton) ------------------------------------------
@@ -517,24 +520,30 @@ _bedrock_client_config = Config(
 # Extended thinking requires temperature=1 (Bedrock requirement) and a model
 # that supports it (Claude claude-haiku-4-5 / Sonnet 4.x+).
 
-_model: "BedrockModel | None" = None
+_models: "dict[str, BedrockModel]" = {}
 
 
-def _get_model() -> "BedrockModel":
-    """Return the shared BedrockModel, building it on first call."""
-    global _model
-    if _model is not None:
-        return _model
+def _get_model(model_id: str | None = None) -> "BedrockModel":
+    """Return the shared BedrockModel for model_id, building it on first call."""
+    model_id = model_id or os.getenv("EAGLE_BEDROCK_MODEL_ID") or MODEL
+    cached = _models.get(model_id)
+    if cached is not None:
+        return cached
 
-    model_id = os.getenv("EAGLE_BEDROCK_MODEL_ID") or MODEL
     extended = os.getenv("EAGLE_EXTENDED_THINKING", "0").lower() in ("1", "true", "yes")
     budget = int(os.getenv("EAGLE_THINKING_BUDGET_TOKENS", "8000"))
+    # "optimized" requests Bedrock latency-optimized inference; only some
+    # models/regions support it, so it stays opt-in.
+    latency_mode = os.getenv("EAGLE_BEDROCK_LATENCY_MODE", "standard").lower()
 
     kwargs: dict = dict(
         model_id=model_id,
         region_name=os.getenv("AWS_REGION", "us-east-1"),
         boto_client_config=_bedrock_client_config,
     )
+    if latency_mode == "optimized":
+        kwargs["additional_args"] = {"performanceConfig": {"latency": "optimized"}}
+        logger.info("EAGLE Bedrock latency-optimized inference ENABLED (model=%s)", model_id)
     if extended:
         kwargs["additional_request_fields"] = {
             "thinking": {"type": "enabled", "budget_tokens": budget}
@@ -544,8 +553,50 @@ def _get_model() -> "BedrockModel":
     else:
         logger.info("EAGLE model: %s (thinking off)", model_id)
 
-    _model = BedrockModel(**kwargs)
-    return _model
+    model = BedrockModel(**kwargs)
+    _models[model_id] = model
+    return model
+
+
+# -- Prompt-complexity routing (opt-in) --------------------------------------
+# EAGLE_MODEL_ROUTING=1 sends short, conversational prompts on lower tiers to
+# Haiku instead of the default model. Anything that looks like document work
+# or analysis stays on the default model, as does every premium request.
+
+_COMPLEX_PROMPT_RE = re.compile(
+    r"\b(?:generat|draft|writ|creat|analy[sz]|compar|review|evaluat|justif"
+    r"|sow|igce|statement of work|acquisition plan|market research|compliance"
+    r"|far\b|dfars|j&a|solicitation|evaluation criteria)",
+    re.IGNORECASE,
+)
+
+_SIMPLE_PROMPT_MAX_CHARS = 160
+_MEDIUM_PROMPT_MAX_CHARS = 600
+
+_TIER_MODEL_ROUTES: dict[str, dict[str, str]] = {
+    "basic": {"simple": _HAIKU, "medium": _HAIKU},
+    "advanced": {"simple": _HAIKU},
+}
+
+
+def _classify_prompt(prompt: str) -> str:
+    """Cheaply bucket a prompt into simple / medium / complex."""
+    if len(prompt) > _MEDIUM_PROMPT_MAX_CHARS or _COMPLEX_PROMPT_RE.search(prompt):
+        return "complex"
+    if len(prompt) > _SIMPLE_PROMPT_MAX_CHARS or "\n" in prompt:
+        return "medium"
+    return "simple"
+
+
+def _route_model_id(prompt: str, tier: str) -> str | None:
+    """Return the model id to use for prompt on tier, or None for the default."""
+    if os.getenv("EAGLE_MODEL_ROUTING", "0").lower() not in ("1", "true", "yes"):
+        return None
+    complexity = _classify_prompt(prompt)
+    model_id = _TIER_MODEL_ROUTES.get(tier, {}).get(complexity)
+    if model_id:
+        logger.debug("Model routing: tier=%s complexity=%s -> %s", tier, complexity, model_id)
+    return model_id
 
 # Tier-gated tool access (preserved from sdk_agentic_service.py)
 # Note: Strands subagents don't use CLI tools like Read/Glob/Grep.
@@ -577,6 +628,17 @@ _DOC_TYPE_HINTS: list[tuple[str, list[str]]] = [
     ("cor_certification", ["cor certification"]),
     ("contract_type_justification", ["contract type justification"]),
 ]
+# All hints in one alternation, ranked by _DOC_TYPE_HINTS order. The lookahead
+# reports overlapping hits (e.g. "justification" inside "contract type
+# justification") so the best-ranked doc type wins, as with a per-type scan.
+_DOC_TYPE_HINT_RANK: dict[str, int] = {
+    hint: rank for rank, (_, hints) in enumerate(_DOC_TYPE_HINTS) for hint in hints
+}
+_DOC_TYPE_HINT_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(h) for h in sorted(_DOC_TYPE_HINT_RANK, key=_DOC_TYPE_HINT_RANK.__getitem__))
+    + "))"
+)
 _DOC_TYPE_LABELS: dict[str, str] = {
     "sow": "Statement of Work",
     "igce": "Independent Government Cost Estimate",
@@ -611,8 +673,23 @@ _PROMPT_SECTION_ALIASES = {
 }
 
 
+# Compiled once; these run on every chat message via the document fast path.
+_WHITESPACE_RE = re.compile(r"\s+")
+_DOC_CTX_TITLE_RE = re.compile(r"(?im)^\s*Title:\s*(.+?)\s*$")
+_DOC_CTX_TYPE_RE = re.compile(r"(?im)^\s*Type:\s*([a-z0-9_ -]+)\s*$")
+_DOC_CTX_EXCERPT_RE = re.compile(
+    r"(?is)Current Content Excerpt:\s*(.+?)(?:\n\s*\[ORIGIN SESSION CONTEXT\]|\n\s*\[USER REQUEST\]|$)"
+)
+_DOC_REQUEST_PHRASE_RE: dict[str, re.Pattern] = {
+    doc_type: re.compile(
+        rf"\b(need|want|please)\b.*\b{re.escape(_DOC_TYPE_LABELS.get(doc_type, doc_type.replace('_', ' ')).lower())}\b"
+    )
+    for doc_type, _ in _DOC_TYPE_HINTS
+}
+
+
 def _normalize_prompt(prompt: str) -> str:
-    return re.sub(r"\s+", " ", prompt.strip().lower())
+    return _WHITESPACE_RE.sub(" ", prompt.strip().lower())
 
 
 def _extract_user_request_from_prompt(prompt: str) -> str:
@@ -639,18 +716,15 @@ def _extract_document_context_from_prompt(prompt: str) -> dict[str, str]:
 
     out: dict[str, str] = {}
 
-    title_match = re.search(r"(?im)^\s*Title:\s*(.+?)\s*$", prompt)
+    title_match = _DOC_CTX_TITLE_RE.search(prompt)
     if title_match:
         out["title"] = title_match.group(1).strip()
 
-    type_match = re.search(r"(?im)^\s*Type:\s*([a-z0-9_ -]+)\s*$", prompt)
+    type_match = _DOC_CTX_TYPE_RE.search(prompt)
     if type_match:
         out["document_type"] = type_match.group(1).strip().lower().replace(" ", "_")
 
-    excerpt_match = re.search(
-        r"(?is)Current Content Excerpt:\s*(.+?)(?:\n\s*\[ORIGIN SESSION CONTEXT\]|\n\s*\[USER REQUEST\]|$)",
-        prompt,
-    )
+    excerpt_match = _DOC_CTX_EXCERPT_RE.search(prompt)
     if excerpt_match:
         out["current_content"] = excerpt_match.group(1).strip()
 
@@ -661,20 +735,21 @@ def _extract_document_context_from_prompt(prompt: str) -> dict[str, str]:
     return out
 
 
-def _infer_doc_type_from_prompt(prompt: str) -> str | None:
-    lowered = f" {_normalize_prompt(prompt)} "
-    for doc_type, hints in _DOC_TYPE_HINTS:
-        if any(hint in lowered for hint in hints):
-            return doc_type
-    return None
+def _infer_doc_type_from_prompt(prompt: str, normalized: str | None = None) -> str | None:
+    lowered = f" {normalized if normalized is not None else _normalize_prompt(prompt)} "
+    best = min(
+        (_DOC_TYPE_HINT_RANK[m.group(1)] for m in _DOC_TYPE_HINT_RE.finditer(lowered)),
+        default=None,
+    )
+    return None if best is None else _DOC_TYPE_HINTS[best][0]
 
 
-def _is_document_generation_request(prompt: str) -> tuple[bool, str | None]:
-    lowered = _normalize_prompt(prompt)
-    doc_type = _infer_doc_type_from_prompt(prompt)
+def _is_document_generation_request(prompt: str, normalized: str | None = None) -> tuple[bool, str | None]:
+    lowered = normalized if normalized is not None else _normalize_prompt(prompt)
+    doc_type = _infer_doc_type_from_prompt(prompt, lowered)
     if not doc_type:
         return False, None
-    if any(lowered.startswith(blocker) for blocker in _DOC_REQUEST_BLOCKERS):
+    if lowered.startswith(_DOC_REQUEST_BLOCKERS):
         return False, None
     if any(v in lowered for v in _DIRECT_DOC_VERBS):
         return True, doc_type
@@ -689,18 +764,18 @@ def _is_document_generation_request(prompt: str) -> tuple[bool, str | None]:
     phrase = _DOC_TYPE_LABELS.get(doc_type, doc_type.replace("_", " ")).lower()
     if lowered.startswith(phrase):
         return True, doc_type
-    if re.search(rf"\b(need|want|please)\b.*\b{re.escape(phrase)}\b", lowered):
+    if _DOC_REQUEST_PHRASE_RE[doc_type].search(lowered):
         return True, doc_type
 
     return False, None
 
 
 def _should_use_fast_document_path(prompt: str) -> tuple[bool, str | None]:
-    should_generate, doc_type = _is_document_generation_request(prompt)
+    lowered = _normalize_prompt(prompt)
+    should_generate, doc_type = _is_document_generation_request(prompt, lowered)
     if not should_generate or not doc_type:
         return False, None
 
-    lowered = _normalize_prompt(prompt)
     if "[document context]" in lowered:
         return False, None
     if any(h in lowered for h in _SLOW_PATH_HINTS):
@@ -733,13 +808,22 @@ def _extract_prompt_sections(prompt: str) -> dict[str, list[str]]:
     return sections
 
 
-def _extract_context_data_from_prompt(prompt: str, doc_type: str) -> dict[str, Any]:
-    """Derive create_document data fields from the current user prompt."""
+def _extract_context_data_from_prompt(
+    prompt: str,
+    doc_type: str,
+    doc_ctx: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Derive create_document data fields from the current user prompt.
+
+    Callers that already ran _extract_document_context_from_prompt can pass
+    its result as doc_ctx to avoid scanning the prompt twice.
+    """
     if not prompt:
         return {}
 
     data: dict[str, Any] = {}
-    doc_ctx = _extract_document_context_from_prompt(prompt)
+    if doc_ctx is None:
+        doc_ctx = _extract_document_context_from_prompt(prompt)
     if doc_ctx.get("current_content"):
         data["current_content"] = doc_ctx["current_content"]
     if doc_ctx.get("user_request"):
@@ -869,7 +953,7 @@ async def _maybe_fast_path_document_generation(
         "doc_type": doc_type,
         "title": doc_ctx.get("title") or _fast_path_title(prompt, doc_type),
     }
-    contextual_data = _extract_context_data_from_prompt(prompt, doc_type)
+    contextual_data = _extract_context_data_from_prompt(prompt, doc_type, doc_ctx)
     if contextual_data:
         params["data"] = contextual_data
     if (
@@ -905,8 +989,10 @@ async def _ensure_create_document_for_direct_request(
     This reconciles cases where the model produced inline draft content without
     invoking create_document, which breaks document-card/editing UX.
     """
+    if "create_document" in tools_called or "generate_document" in tools_called:
+        return None
     should_generate, doc_type = _is_document_generation_request(prompt)
-    if not should_generate or not doc_type or "create_document" in tools_called or "generate_document" in tools_called:
+    if not should_generate or not doc_type:
         return None
 
     from .tool_dispatch import _exec_create_document
@@ -916,7 +1002,7 @@ async def _ensure_create_document_for_direct_request(
         "doc_type": doc_type,
         "title": doc_ctx.get("title") or _fast_path_title(prompt, doc_type),
     }
-    contextual_data = _extract_context_data_from_prompt(prompt, doc_type)
+    contextual_data = _extract_context_data_from_prompt(prompt, doc_type, doc_ctx)
     if contextual_data:
         params["data"] = contextual_data
     if (
@@ -1627,30 +1713,14 @@ def _make_subagent_tool(
 # tool_result events reach the frontend for tool card observability.
 
 
-def _emit_tool_result(
-    tool_name: str,
-    result_str: str,
-    result_queue: asyncio.Queue | None,
-    loop: asyncio.AbstractEventLoop | None,
-):
-    """Emit a tool_result event to the frontend via result_queue."""
-    if not result_queue or not loop:
-        return
+def _tool_json(obj: Any) -> str:
+    """Pretty-print a tool result for the model (orjson; stdlib json fallback)."""
     try:
-        parsed = json.loads(result_str) if isinstance(result_str, str) else result_str
-    except (json.JSONDecodeError, TypeError):
-        parsed = {"raw": result_str[:2000]} if result_str else {}
-    # Truncate large text fields to avoid SSE bloat
-    if isinstance(parsed, dict):
-        for key in ("content", "text", "body"):
-            val = parsed.get(key)
-            if isinstance(val, str) and len(val) > 2000:
-                parsed = {**parsed, key: val[:2000] + "..."}
-                break
-    loop.call_soon_threadsafe(
-        result_queue.put_nowait,
-        {"type": "tool_result", "name": tool_name, "result": parsed},
-    )
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        return json.dumps(obj, indent=2, default=str)
 
 
 def _make_list_skills_tool(
@@ -1701,7 +1771,7 @@ def _make_list_skills_tool(
                     })
             result["data"] = data_list
 
-        out = json.dumps(result, indent=2)
+        out = _tool_json(result)
         _emit_tool_result("list_skills", out, result_queue, loop)
         return out
 
@@ -1787,11 +1857,11 @@ def _make_load_data_tool(
                 })
                 _emit_tool_result("load_data", out, result_queue, loop)
                 return out
-            out = json.dumps({section: value}, indent=2, default=str)
+            out = _tool_json({section: value})
             _emit_tool_result("load_data", out, result_queue, loop)
             return out
 
-        out = json.dumps(data, indent=2, default=str)
+        out = _tool_json(data)
         _emit_tool_result("load_data", out, result_queue, loop)
         return out
 
@@ -1943,7 +2013,7 @@ def _make_compliance_matrix_tool(
 
         parsed = json.loads(params) if isinstance(params, str) else params
         result = execute_operation(parsed)
-        out = json.dumps(result, indent=2, default=str)
+        out = _tool_json(result)
         _emit_tool_result("query_compliance_matrix", out, result_queue, loop)
         return out
 
@@ -2343,7 +2413,7 @@ def _make_create_document_tool(
                 {"type": "metadata", "content": doc_ready_payload},
             )
 
-        return json.dumps(result, indent=2, default=str)
+        return _tool_json(result)
 
     return create_document
 
@@ -2799,6 +2869,58 @@ def build_skill_tools(
 
 # -- Supervisor Prompt -----------------------------------------------
 
+# Static guidance appended to every supervisor prompt; built once at import.
+_SUPERVISOR_GUIDANCE = (
+    "Progressive Disclosure:\n"
+    "  Layer 1 — System prompt (descriptions above).\n"
+    "  Layer 2 — list_skills(): discover skills, agents, data files.\n"
+    "  Layer 3 — load_skill(name): read full workflow to follow yourself.\n"
+    "  Layer 4 — load_data(name, section?): fetch reference data.\n"
+    "  Only spawn a specialist when you need expert reasoning, not simple lookups.\n\n"
+    "KB Retrieval:\n"
+    "  1) knowledge_search first for policy/regulation/template questions.\n"
+    "  2) knowledge_fetch on top 1-3 results.\n"
+    "  3) Include Sources section (title + s3_key) in answer.\n"
+    "  4) Prefer KB over search_far. Use search_far as fallback.\n\n"
+    "Document Output:\n"
+    "  1) MUST call create_document for generate/draft requests.\n"
+    "  2) Don't paste full bodies in chat — direct to document card.\n"
+    "  3) After create_document → call update_state(state_type='document_ready').\n\n"
+    "State Push (update_state) — MANDATORY:\n"
+    "  - create_document → update_state('document_ready', package_id, doc_type)\n"
+    "  - compliance_matrix → update_state('checklist_update', package_id)\n"
+    "  - phase change → update_state('phase_change', package_id, phase)\n"
+    "  - compliance finding → update_state('compliance_alert', severity, items)\n"
+    "  CRITICAL: call update_state('phase_change') BEFORE final synthesis text.\n\n"
+    "Citations:\n"
+    "  Cite FAR sections: 'Per FAR 15.306(c)...'\n"
+    "  Cite GAO decisions: '*Equitus Corp.*, B-419701 (May 12, 2021)'\n"
+    "  Include [(Author, Year)](url) for web sources. End with References section.\n"
+    "  NEVER fabricate citations, thresholds, or case holdings. Use tools for authoritative data.\n\n"
+    "Think Tool: Use think() before complex analysis. Include full KB/search context.\n\n"
+    "FAST vs DEEP:\n"
+    "  FAST: load_data, query_compliance_matrix, search_far, knowledge_search, load_skill.\n"
+    "  DEEP: specialist subagents for complex analysis or expert reasoning only.\n"
+    "  ALWAYS prefer FAST first. Delegate only when FAST tools don't suffice."
+)
+
+_SUPERVISOR_FALLBACK_PROMPT = "You are the EAGLE Supervisor Agent for NCI Office of Acquisitions."
+
+
+@lru_cache(maxsize=64)
+def _specialist_list(names: tuple[str, ...]) -> str:
+    """Render the ACTIVE SPECIALISTS bullet list for a set of agent names.
+
+    SKILL_AGENT_REGISTRY is built once at import, so the rendering only
+    depends on which names are active.
+    """
+    return "\n".join(
+        f"- {name}: {SKILL_AGENT_REGISTRY[name]['description']}"
+        for name in names
+        if name in SKILL_AGENT_REGISTRY
+    )
+
+
 def build_supervisor_prompt(
     tenant_id: str = "demo-tenant",
     user_id: str = "demo-user",
@@ -2811,12 +2933,7 @@ def build_supervisor_prompt(
     Loads the base supervisor prompt from the 4-layer resolution chain when
     workspace_id is provided; otherwise falls back to AGENTS bundled content.
     """
-    names = agent_names or list(SKILL_AGENT_REGISTRY.keys())
-    agent_list = "\n".join(
-        f"- {name}: {SKILL_AGENT_REGISTRY[name]['description']}"
-        for name in names
-        if name in SKILL_AGENT_REGISTRY
-    )
+    agent_list = _specialist_list(tuple(agent_names or SKILL_AGENT_REGISTRY))
 
     # Resolve supervisor prompt via workspace chain
     base_prompt = ""
@@ -2829,44 +2946,14 @@ def build_supervisor_prompt(
 
     if not base_prompt:
         supervisor_entry = AGENTS.get("supervisor")
-        base_prompt = supervisor_entry["body"].strip() if supervisor_entry else "You are the EAGLE Supervisor Agent for NCI Office of Acquisitions."
+        base_prompt = supervisor_entry["body"].strip() if supervisor_entry else _SUPERVISOR_FALLBACK_PROMPT
 
     return (
         f"Tenant: {tenant_id} | User: {user_id} | Tier: {tier}\n\n"
         f"{base_prompt}\n\n"
         f"--- ACTIVE SPECIALISTS ---\n"
         f"Available specialists for delegation:\n{agent_list}\n\n"
-        "Progressive Disclosure:\n"
-        "  Layer 1 — System prompt (descriptions above).\n"
-        "  Layer 2 — list_skills(): discover skills, agents, data files.\n"
-        "  Layer 3 — load_skill(name): read full workflow to follow yourself.\n"
-        "  Layer 4 — load_data(name, section?): fetch reference data.\n"
-        "  Only spawn a specialist when you need expert reasoning, not simple lookups.\n\n"
-        "KB Retrieval:\n"
-        "  1) knowledge_search first for policy/regulation/template questions.\n"
-        "  2) knowledge_fetch on top 1-3 results.\n"
-        "  3) Include Sources section (title + s3_key) in answer.\n"
-        "  4) Prefer KB over search_far. Use search_far as fallback.\n\n"
-        "Document Output:\n"
-        "  1) MUST call create_document for generate/draft requests.\n"
-        "  2) Don't paste full bodies in chat — direct to document card.\n"
-        "  3) After create_document → call update_state(state_type='document_ready').\n\n"
-        "State Push (update_state) — MANDATORY:\n"
-        "  - create_document → update_state('document_ready', package_id, doc_type)\n"
-        "  - compliance_matrix → update_state('checklist_update', package_id)\n"
-        "  - phase change → update_state('phase_change', package_id, phase)\n"
-        "  - compliance finding → update_state('compliance_alert', severity, items)\n"
-        "  CRITICAL: call update_state('phase_change') BEFORE final synthesis text.\n\n"
-        "Citations:\n"
-        "  Cite FAR sections: 'Per FAR 15.306(c)...'\n"
-        "  Cite GAO decisions: '*Equitus Corp.*, B-419701 (May 12, 2021)'\n"
-        "  Include [(Author, Year)](url) for web sources. End with References section.\n"
-        "  NEVER fabricate citations, thresholds, or case holdings. Use tools for authoritative data.\n\n"
-        "Think Tool: Use think() before complex analysis. Include full KB/search context.\n\n"
-        "FAST vs DEEP:\n"
-        "  FAST: load_data, query_compliance_matrix, search_far, knowledge_search, load_skill.\n"
-        "  DEEP: specialist subagents for complex analysis or expert reasoning only.\n"
-        "  ALWAYS prefer FAST first. Delegate only when FAST tools don't suffice."
+        f"{_SUPERVISOR_GUIDANCE}"
     )
 
 
@@ -3046,7 +3133,7 @@ async def sdk_query(
     _ensure_langfuse_exporter()
 
     supervisor = Agent(
-        model=_get_model(),
+        model=_get_model(_route_model_id(prompt, tier)),
         system_prompt=system_prompt,
         tools=skill_tools + service_tools,
         callback_handler=None,
@@ -3314,7 +3401,7 @@ async def sdk_query_streaming(
     _ensure_langfuse_exporter()
 
     supervisor = Agent(
-        model=_get_model(),
+        model=_get_model(_route_model_id(prompt, tier)),
         system_prompt=system_prompt,
         tools=skill_tools + service_tools,
         callback_handler=None,  # stream_async yields events directly
@@ -3395,9 +3482,10 @@ async def sdk_query_streaming(
                 continue
 
             # --- Bedrock contentBlockStart fallback ---
-            raw_event = event.get("event", {})
+            raw_event = event.get("event")
             if isinstance(raw_event, dict):
-                cbs = raw_event.get("contentBlockStart", {}).get("start", {}).get("toolUse")
+                block_start = raw_event.get("contentBlockStart")
+                cbs = (block_start.get("start") or {}).get("toolUse") if block_start else None
                 if cbs:
                     tool_id = cbs.get("toolUseId", "")
                     if tool_id != _current_tool_id:
@@ -3417,7 +3505,7 @@ async def sdk_query_streaming(
                     yield {"type": "bedrock_trace", "event": _sanitize_event(event)}
                     continue
                 if "metadata" in raw_event:
-                    meta = raw_event.get("metadata", {})
+                    meta = raw_event["metadata"]
                     if isinstance(meta, dict) and "usage" in meta:
                         yield {"type": "bedrock_trace", "event": _sanitize_event(event)}
                     continue
@@ -1,33 +1,62 @@
-from typing import Dict
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 from app.models import SubscriptionTier, TierLimits, SubscriptionUsage
 from app.stores import session_store
 
+# ── Usage Cache (5s TTL) ─────────────────────────────────────────────
+# Key: (tenant_id, tier value)
+# Value: {"ts": float, "usage": SubscriptionUsage}
+# Shared by every SubscriptionService instance; absorbs the repeated
+# reads a single request makes (get_usage + check_usage_limits).
+USAGE_CACHE_TTL_SECONDS = 5
+_usage_cache: Dict[Tuple[str, str], Dict] = {}
+
+
+def _usage_cache_get(tenant_id: str, tier: SubscriptionTier) -> Optional[SubscriptionUsage]:
+    entry = _usage_cache.get((tenant_id, tier.value))
+    if entry is not None and time.time() < entry["ts"] + USAGE_CACHE_TTL_SECONDS:
+        # Callers mutate the returned model (increment_usage), so hand out a copy
+        return entry["usage"].model_copy()
+    return None
+
+
+def _usage_cache_set(usage: SubscriptionUsage) -> None:
+    _usage_cache[(usage.tenant_id, usage.subscription_tier.value)] = {
+        "ts": time.time(),
+        "usage": usage.model_copy(),
+    }
+
+# ── Tier Limits ──────────────────────────────────────────────────────
+# Static per-tier limits, built once at import and shared by every instance.
+TIER_LIMITS: Dict[SubscriptionTier, TierLimits] = {
+    SubscriptionTier.BASIC: TierLimits(
+        daily_messages=50,
+        monthly_messages=1000,
+        max_session_duration=30,
+        concurrent_sessions=1,
+        mcp_server_access=False
+    ),
+    SubscriptionTier.ADVANCED: TierLimits(
+        daily_messages=200,
+        monthly_messages=5000,
+        max_session_duration=120,
+        concurrent_sessions=3,
+        mcp_server_access=True
+    ),
+    SubscriptionTier.PREMIUM: TierLimits(
+        daily_messages=1000,
+        monthly_messages=25000,
+        max_session_duration=480,
+        concurrent_sessions=10,
+        mcp_server_access=True
+    )
+}
+
 class SubscriptionService:
     def __init__(self):
-        self.tier_limits = {
-            SubscriptionTier.BASIC: TierLimits(
-                daily_messages=50,
-                monthly_messages=1000,
-                max_session_duration=30,
-                concurrent_sessions=1,
-                mcp_server_access=False
-            ),
-            SubscriptionTier.ADVANCED: TierLimits(
-                daily_messages=200,
-                monthly_messages=5000,
-                max_session_duration=120,
-                concurrent_sessions=3,
-                mcp_server_access=True
-            ),
-            SubscriptionTier.PREMIUM: TierLimits(
-                daily_messages=1000,
-                monthly_messages=25000,
-                max_session_duration=480,
-                concurrent_sessions=10,
-                mcp_server_access=True
-            )
-        }
+        self.tier_limits = TIER_LIMITS
 
     def get_tier_limits(self, tier: SubscriptionTier) -> TierLimits:
         return self.tier_limits[tier]
@@ -35,6 +64,10 @@ class SubscriptionService:
     async def check_usage_limits(self, tenant_id: str, tier: SubscriptionTier) -> Dict[str, bool]:
         """Check if tenant has exceeded usage limits"""
         usage = await self.get_usage(tenant_id, tier)
+        return self.usage_limit_status(usage, tier)
+
+    def usage_limit_status(self, usage: SubscriptionUsage, tier: SubscriptionTier) -> Dict[str, bool]:
+        """Compare an already-fetched usage record against the tier limits"""
         limits = self.get_tier_limits(tier)
 
         return {
@@ -46,10 +79,14 @@ class SubscriptionService:
 
     async def get_usage(self, tenant_id: str, tier: SubscriptionTier) -> SubscriptionUsage:
         """Get current usage for tenant"""
+        cached = _usage_cache_get(tenant_id, tier)
+        if cached is not None:
+            return cached
+
         try:
-            item = session_store.get_subscription_usage(tenant_id, tier.value)
+            item = await asyncio.to_thread(session_store.get_subscription_usage, tenant_id, tier.value)
             if item:
-                return SubscriptionUsage(
+                usage = SubscriptionUsage(
                     tenant_id=tenant_id,
                     subscription_tier=tier,
                     daily_usage=int(item.get("daily_usage", 0)),
@@ -57,6 +94,8 @@ class SubscriptionService:
                     active_sessions=int(item.get("active_sessions", 0)),
                     last_reset_date=datetime.fromisoformat(item.get("last_reset_date", datetime.now().isoformat()))
                 )
+                _usage_cache_set(usage)
+                return usage
         except Exception:
             pass
 
@@ -69,6 +108,8 @@ class SubscriptionService:
     async def increment_usage(self, tenant_id: str, tier: SubscriptionTier):
         """Increment usage counters"""
         now = datetime.now()
+        # Read-modify-write: start from the stored counters, not a cached copy
+        _usage_cache.pop((tenant_id, tier.value), None)
         usage = await self.get_usage(tenant_id, tier)
 
         # Reset daily counter if new day
@@ -84,7 +125,8 @@ class SubscriptionService:
         usage.monthly_usage += 1
 
         # Store updated usage via session_store
-        session_store.put_subscription_usage(
+        await asyncio.to_thread(
+            session_store.put_subscription_usage,
             tenant_id=tenant_id,
             tier=tier.value,
             daily_usage=usage.daily_usage,
@@ -92,3 +134,4 @@ class SubscriptionService:
             active_sessions=usage.active_sessions,
             last_reset_date=usage.last_reset_date.isoformat(),
         )
+        _usage_cache_set(usage)
@@ -1,15 +1,113 @@
-import requests
+import asyncio
+import functools
+import httpx
+import orjson
 import os
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from app.models import SubscriptionTier
 
+# Shared async HTTP client: non-blocking on the event loop and reused across
+# calls so the TLS handshake to OpenWeatherMap is paid once per connection.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            # HTTP/2, pool limits and retries go on the transport: httpx ignores
+            # the client-level http2=/limits= once an explicit transport is passed.
+            # HTTP/2 multiplexes the geocode + weather calls over one connection;
+            # retries cover connection failures only, not HTTP error statuses.
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+                retries=3,
+            ),
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client (called from the app lifespan on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# ── Response caches ──────────────────────────────────────────────────
+# Geocoding results barely change, and OpenWeatherMap refreshes current
+# conditions/forecasts roughly every 10 minutes, so repeated lookups for the
+# same place are served from memory instead of a round trip.
+GEO_CACHE_TTL_SECONDS = 86400
+WEATHER_CACHE_TTL_SECONDS = 300
+_CACHE_MAX_ENTRIES = 10_000
+_geo_cache: Dict[str, Dict] = {}
+_weather_cache: Dict[str, Dict] = {}
+
+
+def _cache_get(cache: Dict[str, Dict], key: str, ttl: float) -> Any:
+    entry = cache.get(key)
+    if entry is not None and time.time() < entry["ts"] + ttl:
+        return entry["value"]
+    return None
+
+
+def _cache_set(cache: Dict[str, Dict], key: str, value: Any) -> None:
+    if key not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        cache.pop(next(iter(cache)), None)
+    cache[key] = {"ts": time.time(), "value": value}
+
+
+# Single-flight: concurrent misses for the same key share one outbound
+# request instead of each hitting OpenWeatherMap (and the API quota).
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+def _single_flight_done(key: str, future: "asyncio.Future[Any]") -> None:
+    _inflight.pop(key, None)
+    # Mark the exception retrieved: if every waiter was cancelled, nobody
+    # else will, and asyncio would log "Task exception was never retrieved"
+    if not future.cancelled():
+        future.exception()
+
+
+async def _single_flight(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        _inflight[key] = future
+        future.add_done_callback(functools.partial(_single_flight_done, key))
+    # Shielded so one cancelled waiter does not cancel the shared fetch
+    return await asyncio.shield(future)
+
+# OpenWeatherMap endpoints, parsed once; query parameters are passed
+# separately so httpx encodes them (and the location string) per request.
+_GEO_URL = httpx.URL("https://api.openweathermap.org/geo/1.0/direct")
+_ONECALL_URL = httpx.URL("https://api.openweathermap.org/data/3.0/onecall")
+
+# Weather tools exposed per subscription tier (static, built once at import).
+# Tuples, so they can be handed out without a defensive copy.
+_WEATHER_TOOLS_BY_TIER: Dict[SubscriptionTier, Tuple[str, ...]] = {
+    SubscriptionTier.BASIC: (),
+    SubscriptionTier.ADVANCED: ("get_current_weather", "get_weather_forecast"),
+    SubscriptionTier.PREMIUM: ("get_current_weather", "get_weather_forecast", "get_weather_alerts"),
+}
+_ADVANCED_WEATHER_TOOLS = frozenset(_WEATHER_TOOLS_BY_TIER[SubscriptionTier.ADVANCED])
+
 class WeatherMCPServer:
     """MCP Server for real-time weather information using OpenWeatherMap API"""
     
     def __init__(self):
         self.api_key = os.getenv('OPENWEATHER_API_KEY', 'demo_key')
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self._endpoint_urls = {
+            endpoint: httpx.URL(f"{self.base_url}/{endpoint}") for endpoint in ("weather", "forecast")
+        }
         self.tools = {
             "get_current_weather": self._get_current_weather,
             "get_weather_forecast": self._get_weather_forecast,
@@ -26,54 +124,74 @@ class WeatherMCPServer:
         except Exception as e:
             return {"error": f"Weather API error: {str(e)}"}
 
-    def _get_coordinates(self, location: str) -> Optional[Dict[str, float]]:
+    async def _get_coordinates(self, location: str) -> Optional[Dict[str, float]]:
         """Get coordinates for location using geocoding API"""
+        cache_key = location.strip().lower()
+        coords = _cache_get(_geo_cache, cache_key, GEO_CACHE_TTL_SECONDS)
+        if coords is not None:
+            return coords
+        return await _single_flight(f"geo:{cache_key}", lambda: self._fetch_coordinates(location, cache_key))
+
+    async def _fetch_coordinates(self, location: str, cache_key: str) -> Optional[Dict[str, float]]:
         try:
-            geo_url = f"https://api.openweathermap.org/geo/1.0/direct?q={location}&limit=1&appid={self.api_key}"
-            response = requests.get(geo_url, timeout=10)
+            response = await _get_http_client().get(
+                _GEO_URL, params={"q": location, "limit": 1, "appid": self.api_key}
+            )
             response.raise_for_status()
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data:
-                    return {"lat": data[0]["lat"], "lon": data[0]["lon"]}
+                    coords = {"lat": data[0]["lat"], "lon": data[0]["lon"]}
+                    _cache_set(_geo_cache, cache_key, coords)
+                    return coords
             return None
         except Exception:
             return None
 
+    async def _get_weather_json(self, endpoint: str, coords: Dict[str, float]) -> Any:
+        """GET a lat/lon-keyed weather endpoint, serving fresh results from the cache."""
+        cache_key = f"{endpoint}:{coords['lat']},{coords['lon']}"
+        data = _cache_get(_weather_cache, cache_key, WEATHER_CACHE_TTL_SECONDS)
+        if data is not None:
+            return data
+        return await _single_flight(cache_key, lambda: self._fetch_weather_json(endpoint, coords, cache_key))
+
+    async def _fetch_weather_json(self, endpoint: str, coords: Dict[str, float], cache_key: str) -> Any:
+        response = await _get_http_client().get(
+            self._endpoint_urls[endpoint],
+            params={"lat": coords["lat"], "lon": coords["lon"], "appid": self.api_key, "units": "metric"},
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        _cache_set(_weather_cache, cache_key, data)
+        return data
+
     async def _get_current_weather(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get real-time current weather for a location"""
         location = args.get("location", "New York")
         
         # Get coordinates first
-        coords = self._get_coordinates(location)
+        coords = await self._get_coordinates(location)
         if not coords:
             return {"error": f"Location '{location}' not found"}
         
         try:
-            # Call OpenWeatherMap current weather API
-            weather_url = f"{self.base_url}/weather?lat={coords['lat']}&lon={coords['lon']}&appid={self.api_key}&units=metric"
-            response = requests.get(weather_url, timeout=10)
-            response.raise_for_status()
-            
-            if response.status_code == 200:
-                data = response.json()
-                weather_data = {
-                    "location": f"{data['name']}, {data['sys']['country']}",
-                    "temperature": f"{data['main']['temp']:.1f}°C",
-                    "condition": data['weather'][0]['description'].title(),
-                    "humidity": f"{data['main']['humidity']}%",
-                    "wind_speed": f"{data['wind']['speed']} m/s",
-                    "visibility": f"{data.get('visibility', 0) / 1000:.1f} km",
-                    "pressure": f"{data['main']['pressure']} hPa",
-                    "feels_like": f"{data['main']['feels_like']:.1f}°C",
-                    "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M")
-                }
-                return {"result": {"current_weather": weather_data}}
-            else:
-                return {"error": f"Weather API returned status {response.status_code}"}
-                
-        except requests.RequestException as e:
+            data = await self._get_weather_json("weather", coords)
+            weather_data = {
+                "location": f"{data['name']}, {data['sys']['country']}",
+                "temperature": f"{data['main']['temp']:.1f}°C",
+                "condition": data['weather'][0]['description'].title(),
+                "humidity": f"{data['main']['humidity']}%",
+                "wind_speed": f"{data['wind']['speed']} m/s",
+                "visibility": f"{data.get('visibility', 0) / 1000:.1f} km",
+                "pressure": f"{data['main']['pressure']} hPa",
+                "feels_like": f"{data['main']['feels_like']:.1f}°C",
+                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M")
+            }
+            return {"result": {"current_weather": weather_data}}
+
+        except httpx.HTTPError as e:
             return {"error": f"Failed to fetch weather data: {str(e)}"}
 
     async def _get_weather_forecast(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -81,72 +199,70 @@ class WeatherMCPServer:
         location = args.get("location", "New York")
         days = min(args.get("days", 3), 5)  # OpenWeatherMap free tier supports 5 days
         
-        coords = self._get_coordinates(location)
+        coords = await self._get_coordinates(location)
         if not coords:
             return {"error": f"Location '{location}' not found"}
         
         try:
-            # Call OpenWeatherMap 5-day forecast API
-            forecast_url = f"{self.base_url}/forecast?lat={coords['lat']}&lon={coords['lon']}&appid={self.api_key}&units=metric"
-            response = requests.get(forecast_url, timeout=10)
-            response.raise_for_status()
+            data = await self._get_weather_json("forecast", coords)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Process forecast data (group by day)
-                daily_forecasts = {}
-                for item in data['list'][:days * 8]:  # 8 forecasts per day (3-hour intervals)
-                    date = datetime.fromtimestamp(item['dt']).strftime('%Y-%m-%d')
-                    if date not in daily_forecasts:
-                        daily_forecasts[date] = {
-                            "date": date,
-                            "high": item['main']['temp_max'],
-                            "low": item['main']['temp_min'],
-                            "condition": item['weather'][0]['description'].title()
-                        }
-                    else:
-                        daily_forecasts[date]['high'] = max(daily_forecasts[date]['high'], item['main']['temp_max'])
-                        daily_forecasts[date]['low'] = min(daily_forecasts[date]['low'], item['main']['temp_min'])
-                
-                forecast_list = []
-                for date_key in sorted(daily_forecasts.keys())[:days]:
-                    forecast = daily_forecasts[date_key]
-                    forecast_list.append({
-                        "date": forecast['date'],
-                        "high": f"{forecast['high']:.1f}°C",
-                        "low": f"{forecast['low']:.1f}°C",
-                        "condition": forecast['condition']
-                    })
-                
-                forecast_data = {
-                    "location": f"{data['city']['name']}, {data['city']['country']}",
-                    "forecast": forecast_list
-                }
-                
-                return {"result": {"weather_forecast": forecast_data}}
-            else:
-                return {"error": f"Forecast API returned status {response.status_code}"}
-                
-        except requests.RequestException as e:
+            # Process forecast data (group by day). Bucket on the epoch day in
+            # the city's own timezone; the date string is formatted once per day.
+            tz_offset = data['city'].get('timezone', 0)
+            daily_forecasts = {}
+            for item in data['list'][:days * 8]:  # 8 forecasts per day (3-hour intervals)
+                bucket = (item['dt'] + tz_offset) // 86400
+                main = item['main']
+                day = daily_forecasts.get(bucket)
+                if day is None:
+                    daily_forecasts[bucket] = {
+                        "high": main['temp_max'],
+                        "low": main['temp_min'],
+                        "condition": item['weather'][0]['description'].title()
+                    }
+                else:
+                    if main['temp_max'] > day['high']:
+                        day['high'] = main['temp_max']
+                    if main['temp_min'] < day['low']:
+                        day['low'] = main['temp_min']
+            
+            forecast_list = []
+            for bucket in sorted(daily_forecasts)[:days]:
+                forecast = daily_forecasts[bucket]
+                forecast_list.append({
+                    "date": datetime.fromtimestamp(bucket * 86400, tz=timezone.utc).strftime('%Y-%m-%d'),
+                    "high": f"{forecast['high']:.1f}°C",
+                    "low": f"{forecast['low']:.1f}°C",
+                    "condition": forecast['condition']
+                })
+            
+            forecast_data = {
+                "location": f"{data['city']['name']}, {data['city']['country']}",
+                "forecast": forecast_list
+            }
+            
+            return {"result": {"weather_forecast": forecast_data}}
+
+        except httpx.HTTPError as e:
             return {"error": f"Failed to fetch forecast data: {str(e)}"}
 
     async def _get_weather_alerts(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get real-time weather alerts for a location"""
         location = args.get("location", "New York")
         
-        coords = self._get_coordinates(location)
+        coords = await self._get_coordinates(location)
         if not coords:
             return {"error": f"Location '{location}' not found"}
         
         try:
             # Call OpenWeatherMap One Call API for alerts (requires subscription)
-            alerts_url = f"https://api.openweathermap.org/data/3.0/onecall?lat={coords['lat']}&lon={coords['lon']}&appid={self.api_key}"
-            response = requests.get(alerts_url, timeout=10)
+            response = await _get_http_client().get(
+                _ONECALL_URL, params={"lat": coords["lat"], "lon": coords["lon"], "appid": self.api_key}
+            )
             response.raise_for_status()
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 alerts = data.get('alerts', [])
                 
                 alerts_data = {
@@ -168,14 +284,23 @@ class WeatherMCPServer:
                 # Fallback for free tier - no alerts available
                 return {"result": {"weather_alerts": {"location": location, "alerts": [], "note": "Weather alerts require premium API access"}}}
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             return {"error": f"Failed to fetch alerts data: {str(e)}"}
 
+_weather_server: Optional[WeatherMCPServer] = None
+
+
+def _get_weather_server() -> WeatherMCPServer:
+    global _weather_server
+    if _weather_server is None:
+        _weather_server = WeatherMCPServer()
+    return _weather_server
+
 class WeatherMCPClient:
     """Client for weather MCP server"""
     
     def __init__(self):
-        self.server = WeatherMCPServer()
+        self.server = _get_weather_server()
 
     async def execute_weather_tool(self, tool_name: str, arguments: Dict[str, Any], tier: SubscriptionTier) -> Dict[str, Any]:
         """Execute weather MCP tool based on subscription tier"""
@@ -190,20 +315,25 @@ class WeatherMCPClient:
         
         # Advanced users get basic weather tools only
         if tier == SubscriptionTier.ADVANCED:
-            if tool_name in ["get_current_weather", "get_weather_forecast"]:
+            if tool_name in _ADVANCED_WEATHER_TOOLS:
                 return await self.server.call_tool(tool_name, arguments)
             else:
                 return {"error": f"Weather tool {tool_name} requires Premium subscription"}
         
         return {"error": "Invalid subscription tier"}
 
-    async def get_available_weather_tools(self, tier: SubscriptionTier) -> List[str]:
+    async def execute_weather_tools_bulk(
+        self, tool_name: str, arguments_list: List[Dict[str, Any]], tier: SubscriptionTier
+    ) -> List[Dict[str, Any]]:
+        """Execute one weather tool for several locations concurrently.
+
+        Each location still geocodes then fetches, but the locations overlap, so
+        N lookups take about two round trips instead of 2N. Results keep input order.
+        """
+        return list(await asyncio.gather(
+            *(self.execute_weather_tool(tool_name, arguments, tier) for arguments in arguments_list)
+        ))
+
+    async def get_available_weather_tools(self, tier: SubscriptionTier) -> Tuple[str, ...]:
         """Get available weather tools for subscription tier"""
-        if tier == SubscriptionTier.BASIC:
-            return []
-        elif tier == SubscriptionTier.ADVANCED:
-            return ["get_current_weather", "get_weather_forecast"]
-        elif tier == SubscriptionTier.PREMIUM:
-            return list(self.server.tools.keys())
-        
-        return []
\ No newline at end of file
+        return _WEATHER_TOOLS_BY_TIER.get(tier, ())
\ No newline at end of file
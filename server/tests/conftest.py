@@ -20,6 +20,9 @@ import pytest
 # Ensure server/ is on the path for app.* imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Skip the app lifespan's AWS client warmup when tests enter TestClient(app)
+os.environ.setdefault("EAGLE_WARMUP", "0")
+
 _PERSIST = os.getenv("EAGLE_PERSIST_TEST_RESULTS", "true").lower() == "true"
 
 # Collected results during the session
@@ -273,7 +273,7 @@ class TestDocumentListEndpoint:
 
     def test_get_documents_returns_list(self, app_with_mocked_s3):
         """GET /api/documents returns JSON array of documents."""
-        with patch("boto3.client", return_value=_mock_s3()):
+        with patch("app.routes.documents._get_s3", return_value=_mock_s3()):
             with TestClient(app_with_mocked_s3) as client:
                 resp = client.get("/api/documents")
 
@@ -14,3 +14,18 @@ def test_specialist_metadata_is_discoverable():
     assert rows
     names = {r["name"] for r in rows}
     assert "supervisor" not in names
+
+
+def test_model_routing_is_opt_in_and_tier_aware(monkeypatch):
+    from app import strands_agentic_service as svc
+
+    assert svc._classify_prompt("what is a simplified acquisition threshold?") == "simple"
+    assert svc._classify_prompt("Draft a statement of work for cloud hosting") == "complex"
+
+    monkeypatch.delenv("EAGLE_MODEL_ROUTING", raising=False)
+    assert svc._route_model_id("quick question", "basic") is None
+
+    monkeypatch.setenv("EAGLE_MODEL_ROUTING", "1")
+    assert svc._route_model_id("quick question", "basic") == svc._HAIKU
+    assert svc._route_model_id("quick question", "premium") is None
+    assert svc._route_model_id("Generate an IGCE for 3 servers", "basic") is None
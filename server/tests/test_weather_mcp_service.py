@@ -0,0 +1,84 @@
+"""Tests for weather_mcp_service.py -- shared OpenWeatherMap HTTP client.
+
+Validates:
+  - _get_http_client(): pool sizing and HTTP/2 are applied to the underlying transport
+  - _get_http_client(): singleton reuse until closed
+  - _single_flight(): concurrent callers share one fetch; failures are retrieved
+
+All tests are fast (no network).
+"""
+import asyncio
+import gc
+from unittest import mock
+
+
+def test_http_client_pool_limits_applied():
+    from app import weather_mcp_service as svc
+
+    real_transport = svc.httpx.AsyncHTTPTransport
+    svc._http_client = None
+    try:
+        with mock.patch.object(svc.httpx, "AsyncHTTPTransport", wraps=real_transport) as transport:
+            svc._get_http_client()
+        transport.assert_called_once()
+        kwargs = transport.call_args.kwargs
+        assert kwargs["limits"] == svc.httpx.Limits(
+            max_connections=50, max_keepalive_connections=20, keepalive_expiry=60
+        )
+        assert kwargs["http2"] is True
+        assert kwargs["retries"] == 3
+    finally:
+        asyncio.run(svc.aclose_http_client())
+
+
+def test_http_client_is_reused_until_closed():
+    from app import weather_mcp_service as svc
+
+    svc._http_client = None
+    client = svc._get_http_client()
+    assert svc._get_http_client() is client
+    asyncio.run(svc.aclose_http_client())
+    assert svc._http_client is None
+
+
+def test_single_flight_shares_one_fetch():
+    from app import weather_mcp_service as svc
+
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return {"lat": 1.0, "lon": 2.0}
+
+    async def main():
+        return await asyncio.gather(*(svc._single_flight("geo:test", fetch) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r == {"lat": 1.0, "lon": 2.0} for r in results)
+    assert "geo:test" not in svc._inflight
+
+
+def test_single_flight_failure_with_cancelled_waiters_is_retrieved():
+    from app import weather_mcp_service as svc
+
+    unhandled = []
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+        waiter = asyncio.ensure_future(svc._single_flight("weather:test", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        # Drop the shared task so a never-retrieved exception would be reported now
+        gc.collect()
+
+    asyncio.run(main())
+    assert "weather:test" not in svc._inflight
+    assert unhandled == []